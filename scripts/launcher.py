@@ -0,0 +1,54 @@
+#!/usr/bin/env -S python3 -S
+# -*- coding: utf-8 -*-
+"""Fast-start launcher for source installs.
+
+Runs the client with site.py disabled (-S) and adds back only the
+site-packages directory of the active virtual environment, so interpreter
+startup does not scan the global/user site directories and their .pth files.
+
+Usage:
+    /path/to/venv/bin/python -S scripts/launcher.py [--mode cli] [--protocol mqtt]
+"""
+import os
+import site
+import sys
+import sysconfig
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _venv_prefix():
+    """Locate the virtual environment of the running interpreter.
+
+    site.py normally detects pyvenv.cfg; with -S we have to do it ourselves.
+    """
+    if os.environ.get("VIRTUAL_ENV"):
+        return os.environ["VIRTUAL_ENV"]
+    prefix = os.path.dirname(os.path.dirname(os.path.abspath(sys.executable)))
+    if os.path.exists(os.path.join(prefix, "pyvenv.cfg")):
+        return prefix
+    return sys.prefix
+
+
+def _add_site_packages():
+    """Add the environment's site-packages (and its .pth files) to sys.path."""
+    prefix = _venv_prefix()
+    paths = sysconfig.get_paths(vars={"base": prefix, "platbase": prefix})
+    for key in ("purelib", "platlib"):
+        if os.path.isdir(paths[key]):
+            site.addsitedir(paths[key])
+
+
+if __name__ == "__main__":
+    # Without -S, site.py has already set up sys.path
+    if sys.flags.no_site:
+        _add_site_packages()
+
+    # Keep bytecode caching on so repeated starts reuse __pycache__
+    sys.dont_write_bytecode = False
+
+    sys.path.insert(0, PROJECT_ROOT)
+
+    from src.entry import main
+
+    sys.exit(main())
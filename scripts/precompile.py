@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pre-populate __pycache__ for the application sources.
+
+Run once after installing or updating the client (with the same interpreter
+that will run main.py) so the first start does not have to parse and compile
+every module under src/.
+"""
+import compileall
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def precompile():
+    """Compile all application modules to bytecode."""
+    src_dir = PROJECT_ROOT / "src"
+    print(f"Compiling {src_dir} with Python {sys.version.split()[0]}")
+
+    # workers=0 uses all available CPUs
+    ok = compileall.compile_dir(str(src_dir), quiet=1, workers=0)
+    ok = compileall.compile_file(str(PROJECT_ROOT / "main.py"), quiet=1) and ok
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if precompile() else 1)
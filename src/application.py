@@ -1,23 +1,25 @@
 import asyncio
-import json
 import platform
+import queue
+import re
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from src.constants.constants import (
     AbortReason,
     AudioConfig,
     DeviceState,
-    EventType,
     ListeningMode,
 )
-from src.display import cli_display, gui_display
 from src.protocols.mqtt_protocol import MqttProtocol
 from src.protocols.websocket_protocol import WebsocketProtocol
 from src.utils.common_utils import handle_verification_code
 from src.utils.config_manager import ConfigManager
+from src.utils.json_utils import json_loads
 from src.utils.logging_config import get_logger
 
 # Handle opus dynamic library before importing opuslib
@@ -36,10 +38,52 @@ except Exception as e:
     logger.critical("Please ensure the opus dynamic library is correctly installed or located in the correct path")
     sys.exit(1)
 
+# AudioCodec imports opuslib, so it must come after setup_opus()
+from src.audio_codecs.audio_codec import AudioCodec  # noqa: E402
+from src.iot.thing_manager import ThingManager  # noqa: E402
+
+# Six or more digits, optionally space separated (e.g. "222944" or "2 2 2 9 4 4")
+_VERIFICATION_RE = re.compile(r"(?:\d\s*){6,}")
+
+
+def _check_verification_code(text):
+    """Handle the verification code in text, if there is one."""
+    if _VERIFICATION_RE.search(text):
+        handle_verification_code(text)
+
+
+def _new_event_loop():
+    """Create the application event loop, preferring uvloop when installed."""
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is unavailable on Windows; the stdlib loop works everywhere
+        loop = asyncio.new_event_loop()
+    else:
+        logger.debug("Using uvloop event loop")
+        loop = uvloop.new_event_loop()
+
+    if sys.version_info >= (3, 12):
+        # Run new tasks up to their first suspension point immediately
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
 
 class Application:
     _instance = None
 
+    # Microphone frames collected before handing them to the event loop
+    TX_BATCH_MAX = 2
+    # Longer TTS sentences are scanned for verification codes in the executor
+    VERIFICATION_SCAN_INLINE_MAX = 256
+    # Minimum seconds between chat text redraws (~30 fps)
+    DISPLAY_TEXT_INTERVAL = 0.033
+    # Workers for blocking helpers (TTS drain wait, stream reinit, ...)
+    BG_EXECUTOR_WORKERS = 4
+    # Wake word detector restart backoff window, in seconds
+    WWD_RESTART_BACKOFF_MIN = 0.5
+    WWD_RESTART_BACKOFF_MAX = 30.0
+
     @classmethod
     def get_instance(cls):
         """Get singleton instance."""
@@ -66,38 +110,67 @@ class Application:
         self.keep_listening = False
         self.aborted = False
         self.current_text = ""
+        self._text_update_handle = None
+        self._last_text_update = 0.0
         self.current_emotion = "neutral"
+        self._init_emotion_paths()
+
+        # Prebuilt state-transition callbacks for schedule()
+        self._set_idle = partial(self.set_device_state, DeviceState.IDLE)
+        self._set_connecting = partial(self.set_device_state, DeviceState.CONNECTING)
+        self._set_listening = partial(self.set_device_state, DeviceState.LISTENING)
+        self._set_speaking = partial(self.set_device_state, DeviceState.SPEAKING)
 
         # Audio processing related
         self.audio_codec = None  # Will be initialized in _initialize_audio
-        self._tts_lock = threading.Lock()
         # Since Display's playback state is only used by GUI and inconvenient for Music_player, this flag indicates TTS is speaking
         self.is_tts_playing = False
 
+        # Wake word detector restart throttling (see _handle_wake_word_error)
+        self._wwd_last_restart = 0.0
+        self._wwd_restart_backoff = self.WWD_RESTART_BACKOFF_MIN
+
+        # IoT device manager, set in _initialize_iot_devices
+        self._thing_manager = None
+
         # Event loop and threads
-        self.loop = asyncio.new_event_loop()
+        self.loop = _new_event_loop()
+        # One small, named pool for schedule_blocking() and run_in_executor()
+        # instead of the loop's lazily created default executor
+        self._bg_executor = ThreadPoolExecutor(
+            max_workers=self.BG_EXECUTOR_WORKERS, thread_name_prefix="app-bg"
+        )
+        self.loop.set_default_executor(self._bg_executor)
         self.loop_thread = None
+        # Set from inside the loop once run_forever() is processing callbacks
+        self._loop_ready = threading.Event()
+        self._loop_thread_id = None
         self.running = False
-        self.input_event_thread = None
-        self.output_event_thread = None
-
-        # Task queue and lock
-        self.main_tasks = []
-        self.mutex = threading.Lock()
 
         # Protocol instance
         self.protocol = None
 
+        # Strong references to fire-and-forget tasks (the loop only keeps weak ones)
+        self._background_tasks = set()
+
         # Callback functions
         self.on_state_changed_callbacks = []
 
-        # Initialize event objects
-        self.events = {
-            EventType.SCHEDULE_EVENT: threading.Event(),
-            EventType.AUDIO_INPUT_READY_EVENT: threading.Event(),
-            EventType.AUDIO_OUTPUT_READY_EVENT: threading.Event(),
+        # Incoming JSON message type -> handler
+        self._msg_handlers = {
+            "tts": self._handle_tts_message,
+            "stt": self._handle_stt_message,
+            "llm": self._handle_llm_message,
+            "iot": self._handle_iot_message,
         }
 
+        # Event queue drained by the main loop: handler callables, None wakes it
+        self._event_q = queue.Queue()
+        # Set while an input-ready event is queued, so triggers never backlog
+        self._input_pending = False
+        # Encoded microphone frames waiting to be sent (main loop thread only)
+        self._tx_batch = []
+
         # Create display interface
         self.display = None
 
@@ -106,7 +179,11 @@ class Application:
         logger.debug("Application instance initialization completed")
 
     def run(self, **kwargs):
-        """Start the application."""
+        """Start the application.
+
+        Returns:
+            The QApplication instance in GUI mode, otherwise None
+        """
         logger.info("Starting application with parameters: %s", kwargs)
         mode = kwargs.get("mode", "gui")
         protocol = kwargs.get("protocol", "websocket")
@@ -128,7 +205,8 @@ class Application:
         self.loop_thread.start()
 
         # Wait for the event loop to be ready
-        time.sleep(0.1)
+        if not self._loop_ready.wait(timeout=2.0):
+            logger.warning("Event loop did not signal readiness within 2s")
 
         # Initialize application (remove automatic connection)
         logger.debug("Initializing application components")
@@ -141,21 +219,47 @@ class Application:
         self.set_display_type(mode)
         # Start GUI
         logger.debug("Starting display interface")
-        self.display.start()
+        return self.display.start()
 
     def _run_event_loop(self):
         """Thread function to run the event loop."""
         logger.debug("Setting up and starting event loop")
         asyncio.set_event_loop(self.loop)
+        self._loop_thread_id = threading.get_ident()
+        self.loop.call_soon(self._loop_ready.set)
         self.loop.run_forever()
 
+    def _submit(self, coro):
+        """Run a coroutine on the event loop without waiting for its result.
+
+        Unlike run_coroutine_threadsafe this does not allocate a
+        concurrent.futures.Future or chain it to the task. From the loop
+        thread itself the task is still started on the next iteration, but
+        without the self-pipe wakeup.
+        """
+        if threading.get_ident() == self._loop_thread_id:
+            self.loop.call_soon(self._spawn_task, coro)
+        else:
+            self.loop.call_soon_threadsafe(self._spawn_task, coro)
+
+    def _spawn_task(self, coro):
+        """Create a task on the loop thread and keep it alive until done."""
+        task = self.loop.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+
+    def _on_background_task_done(self, task):
+        """Release a finished background task and log its failure, if any."""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background task failed: %r", task.exception())
+
     def set_is_tts_playing(self, value: bool):
-        with self._tts_lock:
-            self.is_tts_playing = value
+        # A single attribute store is atomic under the GIL; no lock needed
+        self.is_tts_playing = value
 
     def get_is_tts_playing(self) -> bool:
-        with self._tts_lock:
-            return self.is_tts_playing
+        return self.is_tts_playing
 
     async def _initialize_without_connect(self):
         """Initialize application components (without establishing connection)."""
@@ -163,7 +267,7 @@ class Application:
 
         # Set device state to idle
         logger.debug("Setting initial device state to IDLE")
-        self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
+        self.schedule(self._set_idle)
 
         # Initialize audio codec
         logger.debug("Initializing audio codec")
@@ -186,8 +290,6 @@ class Application:
         """Initialize audio devices and codec."""
         try:
             logger.debug("Starting audio codec initialization")
-            from src.audio_codecs.audio_codec import AudioCodec
-
             self.audio_codec = AudioCodec()
             logger.info("Audio codec initialized successfully")
 
@@ -219,8 +321,11 @@ class Application:
         """Initialize display interface."""
         logger.debug("Setting display interface type: %s", mode)
         # Manage different display modes through the adapter concept
+        # Display modules are imported here so CLI mode never loads PyQt5
         if mode == "gui":
-            self.display = gui_display.GuiDisplay()
+            from src.display.gui_display import GuiDisplay
+
+            self.display = GuiDisplay()
             logger.debug("GUI display interface created")
             self.display.set_callbacks(
                 press_callback=self.start_listening,
@@ -236,7 +341,9 @@ class Application:
                 send_text_callback=self._send_text_tts,
             )
         else:
-            self.display = cli_display.CliDisplay()
+            from src.display.cli_display import CliDisplay
+
+            self.display = CliDisplay()
             logger.debug("CLI display interface created")
             self.display.set_callbacks(
                 auto_callback=self.toggle_chat_state,
@@ -256,52 +363,93 @@ class Application:
         self.running = True
 
         while self.running:
-            # Wait for events
-            for event_type, event in self.events.items():
-                if event.is_set():
-                    event.clear()
-                    logger.debug("Processing event: %s", event_type)
-
-                    if event_type == EventType.AUDIO_INPUT_READY_EVENT:
-                        self._handle_input_audio()
-                    elif event_type == EventType.AUDIO_OUTPUT_READY_EVENT:
-                        self._handle_output_audio()
-                    elif event_type == EventType.SCHEDULE_EVENT:
-                        self._process_scheduled_tasks()
-
-            # Short sleep to avoid high CPU usage
-            time.sleep(0.01)
-
-    def _process_scheduled_tasks(self):
-        """Process scheduled tasks."""
-        with self.mutex:
-            tasks = self.main_tasks.copy()
-            self.main_tasks.clear()
-
-        logger.debug("Processing %d scheduled tasks", len(tasks))
-        for task in tasks:
-            try:
-                task()
-            except Exception as e:
-                logger.error("Error executing scheduled task: %s", e, exc_info=True)
+            # Block until an event arrives; events are the handlers themselves
+            handler = self._event_q.get()
+            if handler is not None:  # None is the wake-up posted by shutdown()
+                handler()
+
+    def _on_input_ready(self):
+        self._input_pending = False
+        self._handle_input_audio()
+
+    def _post_input_ready(self):
+        """Queue an input-ready event unless one is already pending."""
+        if not self._input_pending:
+            self._input_pending = True
+            self._event_q.put(self._on_input_ready)
 
     def schedule(self, callback):
-        """Schedule a task to the main loop."""
-        with self.mutex:
-            self.main_tasks.append(callback)
-        self.events[EventType.SCHEDULE_EVENT].set()
+        """Schedule a task to run on the event loop thread.
+
+        Callbacks must not block; use schedule_blocking() for work that waits
+        on the loop or sleeps.
+        """
+        if threading.get_ident() == self._loop_thread_id:
+            # Already on the loop thread: no self-pipe wakeup needed
+            self.loop.call_soon(self._run_scheduled, callback)
+        else:
+            self.loop.call_soon_threadsafe(self._run_scheduled, callback)
+
+    def schedule_many(self, *callbacks):
+        """Schedule several callbacks to run in order with a single loop wakeup."""
+        self.schedule(partial(self._run_scheduled_many, callbacks))
+
+    def schedule_blocking(self, callback):
+        """Schedule a task that may block to run in the loop's executor."""
+        self.loop.call_soon_threadsafe(
+            self.loop.run_in_executor, None, self._run_scheduled, callback
+        )
+
+    @staticmethod
+    def _run_scheduled(callback):
+        """Run a scheduled task, logging instead of propagating errors."""
+        try:
+            callback()
+        except Exception as e:
+            logger.error("Error executing scheduled task: %s", e, exc_info=True)
+
+    @classmethod
+    def _run_scheduled_many(cls, callbacks):
+        """Run scheduled tasks in order; one failing does not stop the rest."""
+        for callback in callbacks:
+            cls._run_scheduled(callback)
 
     def _handle_input_audio(self):
-        """Handle audio input."""
+        """Handle audio input.
+
+        The blocking read returns once PortAudio has a full frame, so
+        re-posting the event after each frame paces capture at the hardware
+        period without a separate trigger thread.
+        """
         if self.device_state != DeviceState.LISTENING:
+            self._flush_tx_batch()
             return
 
         # Read and send audio data
         encoded_data = self.audio_codec.read_audio()
         if encoded_data and self.protocol and self.protocol.is_audio_channel_opened():
-            asyncio.run_coroutine_threadsafe(
-                self.protocol.send_audio(encoded_data), self.loop
-            )
+            self._tx_batch.append(encoded_data)
+            if len(self._tx_batch) >= self.TX_BATCH_MAX:
+                self._flush_tx_batch()
+
+        if self.device_state == DeviceState.LISTENING:
+            if encoded_data is None:
+                # Input paused or stream being reset; retry after one frame
+                time.sleep(AudioConfig.FRAME_DURATION / 1000)
+            self._post_input_ready()
+        else:
+            self._flush_tx_batch()
+
+    def _flush_tx_batch(self):
+        """Hand all batched microphone frames to the event loop at once."""
+        if self._tx_batch:
+            frames, self._tx_batch = self._tx_batch, []
+            self._submit(self._send_audio_frames(frames))
+
+    async def _send_audio_frames(self, frames):
+        """Send batched frames back to back, one protocol message each."""
+        for frame in frames:
+            await self.protocol.send_audio(frame)
 
     async def _send_text_tts(self, text):
         """Send text via wake word."""
@@ -310,39 +458,27 @@ class Application:
 
         await self.protocol.send_wake_word_detected(text)
 
-    def _handle_output_audio(self):
-        """Handle audio output."""
-        if self.device_state != DeviceState.SPEAKING:
-            return
-        self.set_is_tts_playing(True)  # Start playback
-        self.audio_codec.play_audio()
-
     def _on_network_error(self, error_message=None):
         """Network error callback."""
         if error_message:
             logger.error(error_message)
 
         self.keep_listening = False
-        self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
-        # Resume wake word detection
-        if self.wake_word_detector and self.wake_word_detector.paused:
-            self.wake_word_detector.resume()
+        was_connecting = self.device_state == DeviceState.CONNECTING
+        # Go idle and resume wake word detection in one loop wakeup
+        self.schedule_many(self._set_idle, self._wwd_resume_if_paused)
 
-        if self.device_state != DeviceState.CONNECTING:
+        if not was_connecting:
             logger.info("Connection disconnection detected")
-            self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
-
             # Close existing connection without closing audio stream
             if self.protocol:
-                asyncio.run_coroutine_threadsafe(
-                    self.protocol.close_audio_channel(), self.loop
-                )
+                self._submit(self.protocol.close_audio_channel())
 
     def _on_incoming_audio(self, data):
         """Receive audio data callback."""
         if self.device_state == DeviceState.SPEAKING:
+            # The codec's playback thread picks it up from here
             self.audio_codec.write_audio(data)
-            self.events[EventType.AUDIO_OUTPUT_READY_EVENT].set()
 
     def _on_incoming_json(self, json_data):
         """Receive JSON data callback."""
@@ -351,20 +487,15 @@ class Application:
                 return
 
             # Parse JSON data
-            if isinstance(json_data, str):
-                data = json.loads(json_data)
+            if isinstance(json_data, (str, bytes)):
+                data = json_loads(json_data)
             else:
                 data = json_data
             # Handle different message types
             msg_type = data.get("type", "")
-            if msg_type == "tts":
-                self._handle_tts_message(data)
-            elif msg_type == "stt":
-                self._handle_stt_message(data)
-            elif msg_type == "llm":
-                self._handle_llm_message(data)
-            elif msg_type == "iot":
-                self._handle_iot_message(data)
+            handler = self._msg_handlers.get(msg_type)
+            if handler:
+                handler(data)
             else:
                 logger.warning(f"Received unknown message type: {msg_type}")
         except Exception as e:
@@ -374,21 +505,22 @@ class Application:
         """Handle TTS message."""
         state = data.get("state", "")
         if state == "start":
-            self.schedule(lambda: self._handle_tts_start())
+            self.schedule(self._handle_tts_start)
         elif state == "stop":
-            self.schedule(lambda: self._handle_tts_stop())
+            self.schedule(self._handle_tts_stop)
         elif state == "sentence_start":
             text = data.get("text", "")
             if text:
                 logger.info(f"<< {text}")
-                self.schedule(lambda: self.set_chat_message("assistant", text))
+                self.schedule(partial(self.set_chat_message, "assistant", text))
 
                 # Check for verification code information
-                import re
-
-                match = re.search(r"((?:\d\s*){6,})", text)
-                if match:
-                    self.schedule(lambda: handle_verification_code(text))
+                if len(text) > self.VERIFICATION_SCAN_INLINE_MAX:
+                    # Scan long sentences in the executor, off the receive path
+                    self.schedule_blocking(partial(_check_verification_code, text))
+                elif _VERIFICATION_RE.search(text):
+                    # Clipboard and browser calls can block; run them in the executor
+                    self.schedule_blocking(partial(handle_verification_code, text))
 
     def _handle_tts_start(self):
         """Handle TTS start event."""
@@ -401,7 +533,7 @@ class Application:
             self.device_state == DeviceState.IDLE
             or self.device_state == DeviceState.LISTENING
         ):
-            self.schedule(lambda: self.set_device_state(DeviceState.SPEAKING))
+            self.schedule(self._set_speaking)
 
         # Commented out code to resume VAD detector
         # if hasattr(self, 'vad_detector') and self.vad_detector:
@@ -410,21 +542,36 @@ class Application:
     def _handle_tts_stop(self):
         """Handle TTS stop event."""
         if self.device_state == DeviceState.SPEAKING:
+            # No more audio is coming: play the tail even if it is shorter
+            # than the pre-buffer
+            self.audio_codec.prime_playback()
+
             # Give audio playback a buffer time to ensure all audio is played
             def delayed_state_change():
-                # Wait until the audio queue is empty
-                # Increase wait attempts to ensure audio is fully played
-                max_wait_attempts = 30  # Increase number of wait attempts
-                wait_interval = 0.1  # Time interval for each wait
-                attempts = 0
-
-                # Wait until queue is empty or max attempts exceeded
-                while (
-                    not self.audio_codec.audio_decode_queue.empty()
-                    and attempts < max_wait_attempts
-                ):
-                    time.sleep(wait_interval)
-                    attempts += 1
+                # --- Force reinitialize input stream ---
+                # Reopening a PortAudio stream blocks, so it is done here in
+                # the executor rather than on the event loop
+                if platform.system() == "Linux":
+                    try:
+                        if self.audio_codec:
+                            self.audio_codec._reinitialize_stream(
+                                is_input=True
+                            )  # Call reinitialize
+                        else:
+                            logger.warning(
+                                "Cannot force reinitialization, audio_codec is None."
+                            )
+                    except Exception as force_reinit_e:
+                        logger.error(
+                            f"Forced reinitialization failed: {force_reinit_e}",
+                            exc_info=True,
+                        )
+                        self.schedule_many(self._set_idle, self._wwd_resume_if_paused)
+                        return
+                # --- End force reinitialization ---
+
+                # Wait until the playback queue has drained (at most 3 seconds)
+                self.audio_codec.drain_event.wait(timeout=3.0)
 
                 # Ensure all data is played out
                 # Add extra wait time to ensure final data is processed
@@ -436,70 +583,48 @@ class Application:
 
                 # State transition
                 if self.keep_listening:
-                    asyncio.run_coroutine_threadsafe(
-                        self.protocol.send_start_listening(ListeningMode.AUTO_STOP),
-                        self.loop,
+                    self._submit(
+                        self.protocol.send_start_listening(ListeningMode.AUTO_STOP)
                     )
-                    self.schedule(lambda: self.set_device_state(DeviceState.LISTENING))
+                    self.schedule(self._set_listening)
                 else:
-                    self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
+                    self.schedule(self._set_idle)
 
-            # --- Force reinitialize input stream ---
-            if platform.system() == "Linux":
-                try:
-                    if self.audio_codec:
-                        self.audio_codec._reinitialize_stream(
-                            is_input=True
-                        )  # Call reinitialize
-                    else:
-                        logger.warning(
-                            "Cannot force reinitialization, audio_codec is None."
-                        )
-                except Exception as force_reinit_e:
-                    logger.error(
-                        f"Forced reinitialization failed: {force_reinit_e}",
-                        exc_info=True,
-                    )
-                    self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
-                    if self.wake_word_detector and self.wake_word_detector.paused:
-                        self.wake_word_detector.resume()
-                    return
-            # --- End force reinitialization ---
-
-            # Schedule delayed execution
-            # threading.Thread(target=delayed_state_change, daemon=True).start()
-            self.schedule(delayed_state_change)
+            # Schedule delayed execution; it blocks, so keep it off the loop
+            self.schedule_blocking(delayed_state_change)
 
     def _handle_stt_message(self, data):
         """Handle STT message."""
         text = data.get("text", "")
         if text:
             logger.info(f">> {text}")
-            self.schedule(lambda: self.set_chat_message("user", text))
+            self.schedule(partial(self.set_chat_message, "user", text))
 
     def _handle_llm_message(self, data):
         """Handle LLM message."""
         emotion = data.get("emotion", "")
         if emotion:
-            self.schedule(lambda: self.set_emotion(emotion))
+            self.schedule(partial(self.set_emotion, emotion))
 
     async def _on_audio_channel_opened(self):
         """Audio channel opened callback."""
         logger.info("Audio channel opened")
-        self.schedule(lambda: self._start_audio_streams())
+        # Starting (or reopening) PortAudio streams blocks
+        self.schedule_blocking(self._start_audio_streams)
 
         # Send IoT device descriptors
-        from src.iot.thing_manager import ThingManager
-
-        thing_manager = ThingManager.get_instance()
-        asyncio.run_coroutine_threadsafe(
-            self.protocol.send_iot_descriptors(thing_manager.get_descriptors_json()),
-            self.loop,
+        self._submit(
+            self.protocol.send_iot_descriptors(
+                self._thing_manager.get_descriptors_json()
+            )
         )
-        self._update_iot_states(False)
+        await self._update_iot_states(False)
 
     def _start_audio_streams(self):
-        """Start audio streams."""
+        """Start audio streams.
+
+        Runs in the executor (schedule_blocking); PortAudio calls can block.
+        """
         try:
             # No longer close and reopen streams, just ensure they are active
             if (
@@ -524,86 +649,19 @@ class Application:
                     # Reinitialize only on error
                     self.audio_codec._reinitialize_stream(is_input=False)
 
-            # Set event triggers
-            if (
-                self.input_event_thread is None
-                or not self.input_event_thread.is_alive()
-            ):
-                self.input_event_thread = threading.Thread(
-                    target=self._audio_input_event_trigger, daemon=True
-                )
-                self.input_event_thread.start()
-                logger.info("Input event trigger thread started")
-
-            # Check output event thread
-            if (
-                self.output_event_thread is None
-                or not self.output_event_thread.is_alive()
-            ):
-                self.output_event_thread = threading.Thread(
-                    target=self._audio_output_event_trigger, daemon=True
-                )
-                self.output_event_thread.start()
-                logger.info("Output event trigger thread started")
+            # Pick up a listening state entered before the streams were ready
+            if self.device_state == DeviceState.LISTENING:
+                self._post_input_ready()
 
             logger.info("Audio streams started")
         except Exception as e:
             logger.error(f"Failed to start audio streams: {e}")
 
-    def _audio_input_event_trigger(self):
-        """Audio input event trigger."""
-        while self.running:
-            try:
-                # Trigger input event only in active listening state
-                if (
-                    self.device_state == DeviceState.LISTENING
-                    and self.audio_codec.input_stream
-                ):
-                    self.events[EventType.AUDIO_INPUT_READY_EVENT].set()
-            except OSError as e:
-                logger.error(f"Audio input stream error: {e}")
-                # Do not exit loop, continue trying
-                time.sleep(0.5)
-            except Exception as e:
-                logger.error(f"Audio input event trigger error: {e}")
-                time.sleep(0.5)
-
-            # Ensure high enough trigger frequency even with large frame lengths
-            # Use 20ms as max trigger interval to ensure sufficient sampling rate even with 60ms frame length
-            sleep_time = min(20, AudioConfig.FRAME_DURATION) / 1000
-            time.sleep(sleep_time)  # Trigger based on frame duration, ensuring minimum frequency
-
-    def _audio_output_event_trigger(self):
-        """Audio output event trigger."""
-        while self.running:
-            try:
-                # Ensure output stream is active
-                if (
-                    self.device_state == DeviceState.SPEAKING
-                    and self.audio_codec
-                    and self.audio_codec.output_stream
-                ):
-                    # If output stream is not active, try to reactivate
-                    if not self.audio_codec.output_stream.is_active():
-                        try:
-                            self.audio_codec.output_stream.start_stream()
-                        except Exception as e:
-                            logger.warning(f"Failed to start output stream, attempting reinitialization: {e}")
-                            self.audio_codec._reinitialize_stream(is_input=False)
-
-                    # Trigger event only when there is data in the queue
-                    if not self.audio_codec.audio_decode_queue.empty():
-                        self.events[EventType.AUDIO_OUTPUT_READY_EVENT].set()
-            except Exception as e:
-                logger.error(f"Audio output event trigger error: {e}")
-
-            time.sleep(0.02)  # Slightly extend check interval
-
     async def _on_audio_channel_closed(self):
         """Audio channel closed callback."""
         logger.info("Audio channel closed")
         # Set to idle state without closing audio streams
-        self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
+        self.schedule(self._set_idle)
         self.keep_listening = False
 
         # Ensure wake word detection works normally
@@ -612,16 +670,19 @@ class Application:
                 logger.info("Starting wake word detection in idle state")
                 # Require AudioCodec instance
                 if hasattr(self, "audio_codec") and self.audio_codec:
-                    success = self.wake_word_detector.start(self.audio_codec)
+                    # start() sets up its audio input, so keep it off the loop
+                    success = await self.loop.run_in_executor(
+                        None, self.wake_word_detector.start, self.audio_codec
+                    )
                     if not success:
                         logger.error("Wake word detector failed to start, disabling wake word functionality")
-                        self.config.update_config(
+                        self.config.update_config_deferred(
                             "WAKE_WORD_OPTIONS.USE_WAKE_WORD", False
                         )
                         self.wake_word_detector = None
                 else:
                     logger.error("Audio codec unavailable, unable to start wake word detector")
-                    self.config.update_config("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
+                    self.config.update_config_deferred("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
                     self.wake_word_detector = None
             elif self.wake_word_detector.paused:
                 logger.info("Resuming wake word detection in idle state")
@@ -634,48 +695,36 @@ class Application:
 
         self.device_state = state
 
+        # Update status text and emotion in one display call
+        status_text = self._get_status_text()
+        emotion_path = None
+        if state in (DeviceState.IDLE, DeviceState.LISTENING):
+            self.current_emotion = "neutral"
+            emotion_path = self._get_current_emotion()
+        if self.display is not None:
+            self.display.update_state(status_text, emotion_path)
+
         # Perform actions based on state
         if state == DeviceState.IDLE:
-            self.display.update_status("Idle")
-            # self.display.update_emotion("😶")
-            self.set_emotion("neutral")
-            # Resume wake word detection (with safety checks)
-            if (
-                self.wake_word_detector
-                and hasattr(self.wake_word_detector, "paused")
-                and self.wake_word_detector.paused
-            ):
-                self.wake_word_detector.resume()
+            # Resume wake word detection
+            if self._wwd_resume_if_paused():
                 logger.info("Wake word detection resumed")
             # Resume audio input stream
             if self.audio_codec and self.audio_codec.is_input_paused():
                 self.audio_codec.resume_input()
-        elif state == DeviceState.CONNECTING:
-            self.display.update_status("Connecting...")
         elif state == DeviceState.LISTENING:
-            self.display.update_status("Listening...")
-            self.set_emotion("neutral")
-            self._update_iot_states(True)
-            # Pause wake word detection (with safety checks)
-            if (
-                self.wake_word_detector
-                and hasattr(self.wake_word_detector, "is_running")
-                and self.wake_word_detector.is_running()
-            ):
-                self.wake_word_detector.pause()
+            self._submit(self._update_iot_states(True))
+            # Pause wake word detection
+            if self._wwd_pause_if_running():
                 logger.info("Wake word detection paused")
             # Ensure audio input stream is active
             if self.audio_codec:
                 if self.audio_codec.is_input_paused():
                     self.audio_codec.resume_input()
+            # Start the capture pump
+            self._post_input_ready()
         elif state == DeviceState.SPEAKING:
-            self.display.update_status("Speaking...")
-            if (
-                self.wake_word_detector
-                and hasattr(self.wake_word_detector, "paused")
-                and self.wake_word_detector.paused
-            ):
-                self.wake_word_detector.resume()
+            self._wwd_resume_if_paused()
 
         # Notify state change
         for callback in self.on_state_changed_callbacks:
@@ -684,6 +733,22 @@ class Application:
             except Exception as e:
                 logger.error(f"Error executing state change callback: {e}")
 
+    def _wwd_resume_if_paused(self):
+        """Resume the wake word detector if it exists and is paused."""
+        wwd = self.wake_word_detector
+        if wwd is not None and wwd.paused:
+            wwd.resume()
+            return True
+        return False
+
+    def _wwd_pause_if_running(self):
+        """Pause the wake word detector if it exists and is running."""
+        wwd = self.wake_word_detector
+        if wwd is not None and wwd.is_running():
+            wwd.pause()
+            return True
+        return False
+
     def _get_status_text(self):
         """Get current status text."""
         states = {
@@ -698,15 +763,8 @@ class Application:
         """Get current display text."""
         return self.current_text
 
-    def _get_current_emotion(self):
-        """Get current emotion."""
-        # If emotion hasn't changed, return cached path
-        if (
-            hasattr(self, "_last_emotion")
-            and self._last_emotion == self.current_emotion
-        ):
-            return self._last_emotion_path
-
+    def _init_emotion_paths(self):
+        """Build the emotion name -> GIF path table."""
         # Get base path
         if getattr(sys, "frozen", False):
             # Packaged environment
@@ -720,48 +778,74 @@ class Application:
 
         emotion_dir = base_path / "assets" / "emojis"
 
-        emotions = {
-            "neutral": str(emotion_dir / "neutral.gif"),
-            "happy": str(emotion_dir / "happy.gif"),
-            "laughing": str(emotion_dir / "laughing.gif"),
-            "funny": str(emotion_dir / "funny.gif"),
-            "sad": str(emotion_dir / "sad.gif"),
-            "angry": str(emotion_dir / "angry.gif"),
-            "crying": str(emotion_dir / "crying.gif"),
-            "loving": str(emotion_dir / "loving.gif"),
-            "embarrassed": str(emotion_dir / "embarrassed.gif"),
-            "surprised": str(emotion_dir / "surprised.gif"),
-            "shocked": str(emotion_dir / "shocked.gif"),
-            "thinking": str(emotion_dir / "thinking.gif"),
-            "winking": str(emotion_dir / "winking.gif"),
-            "cool": str(emotion_dir / "cool.gif"),
-            "relaxed": str(emotion_dir / "relaxed.gif"),
-            "delicious": str(emotion_dir / "delicious.gif"),
-            "kissy": str(emotion_dir / "kissy.gif"),
-            "confident": str(emotion_dir / "confident.gif"),
-            "sleepy": str(emotion_dir / "sleepy.gif"),
-            "silly": str(emotion_dir / "silly.gif"),
-            "confused": str(emotion_dir / "confused.gif"),
+        # Check the files once here so a missing GIF falls back to the default
+        # instead of failing to load in the GUI on every emotion change
+        self._emotion_paths = {
+            name: str(emotion_dir / f"{name}.gif")
+            for name in (
+                "neutral",
+                "happy",
+                "laughing",
+                "funny",
+                "sad",
+                "angry",
+                "crying",
+                "loving",
+                "embarrassed",
+                "surprised",
+                "shocked",
+                "thinking",
+                "winking",
+                "cool",
+                "relaxed",
+                "delicious",
+                "kissy",
+                "confident",
+                "sleepy",
+                "silly",
+                "confused",
+            )
+            if (emotion_dir / f"{name}.gif").is_file()
         }
+        self._default_emotion_path = str(emotion_dir / "neutral.gif")
 
-        # Save current emotion and corresponding path
-        self._last_emotion = self.current_emotion
-        self._last_emotion_path = emotions.get(
-            self.current_emotion, str(emotion_dir / "neutral.gif")
+    def _get_current_emotion(self):
+        """Get current emotion."""
+        return self._emotion_paths.get(
+            self.current_emotion, self._default_emotion_path
         )
 
-        logger.debug(f"Emotion path: {self._last_emotion_path}")
-        return self._last_emotion_path
-
     def set_chat_message(self, role, message):
-        """Set chat message."""
+        """Set chat message.
+
+        Called on the event loop (via schedule). Display updates are capped
+        at one per DISPLAY_TEXT_INTERVAL; the latest text always wins.
+        """
+        if message == self.current_text:
+            return
         self.current_text = message
-        # Update display
+        # Update display, unless a trailing update is already pending
+        if not self.display or self._text_update_handle is not None:
+            return
+        delay = self._last_text_update + self.DISPLAY_TEXT_INTERVAL - self.loop.time()
+        if delay <= 0:
+            self._flush_chat_message()
+        else:
+            self._text_update_handle = self.loop.call_later(
+                delay, self._flush_chat_message
+            )
+
+    def _flush_chat_message(self):
+        """Push the current chat text to the display."""
+        self._text_update_handle = None
+        self._last_text_update = self.loop.time()
         if self.display:
-            self.display.update_text(message)
+            self.display.update_text(self.current_text)
 
     def set_emotion(self, emotion):
         """Set emotion."""
+        if emotion == self.current_emotion:
+            return
         self.current_emotion = emotion
         # Update display
         if self.display:
@@ -769,9 +853,9 @@ class Application:
 
     def start_listening(self):
         """Start listening."""
-        self.schedule(self._start_listening_impl)
+        self._submit(self._start_listening_impl())
 
-    def _start_listening_impl(self):
+    async def _start_listening_impl(self):
         """Implementation of start listening."""
         if not self.protocol:
             logger.error("Protocol not initialized")
@@ -784,54 +868,54 @@ class Application:
             self.wake_word_detector.pause()
 
         if self.device_state == DeviceState.IDLE:
-            self.schedule(
-                lambda: self.set_device_state(DeviceState.CONNECTING)
-            )  # Set device state to connecting
+            self.set_device_state(DeviceState.CONNECTING)  # Set device state to connecting
             # Try to open audio channel
             if not self.protocol.is_audio_channel_opened():
                 try:
-                    # Wait for async operation to complete
-                    future = asyncio.run_coroutine_threadsafe(
-                        self.protocol.open_audio_channel(), self.loop
+                    success = await asyncio.wait_for(
+                        self.protocol.open_audio_channel(), timeout=10.0
                     )
-                    # Wait for operation to complete and get result
-                    success = future.result(timeout=10.0)  # Add timeout
 
                     if not success:
                         self.alert("Error", "Failed to open audio channel")  # Show error alert
-                        self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
+                        self.set_device_state(DeviceState.IDLE)
                         return
 
                 except Exception as e:
                     logger.error(f"Error opening audio channel: {e}")
                     self.alert("Error", f"Failed to open audio channel: {str(e)}")
-                    self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
+                    self.set_device_state(DeviceState.IDLE)
                     return
 
             # --- Force reinitialize input stream ---
+            # Reopening a PortAudio stream blocks, so it runs in the executor
+            # while the start-listening message goes out; no audio is sent
+            # before the LISTENING state below, so the order does not matter.
+            reinit = None
+            if self.audio_codec:
+                reinit = self.loop.run_in_executor(
+                    None, partial(self.audio_codec._reinitialize_stream, is_input=True)
+                )
+            else:
+                logger.warning("Cannot force reinitialization, audio_codec is None.")
+
+            await self.protocol.send_start_listening(ListeningMode.MANUAL)
+
             try:
-                if self.audio_codec:
-                    self.audio_codec._reinitialize_stream(
-                        is_input=True
-                    )  # Call reinitialize
-                else:
-                    logger.warning(
-                        "Cannot force reinitialization, audio_codec is None."
-                    )
+                if reinit is not None:
+                    await reinit
             except Exception as force_reinit_e:
                 logger.error(
                     f"Forced reinitialization failed: {force_reinit_e}", exc_info=True
                 )
-                self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
-                if self.wake_word_detector and self.wake_word_detector.paused:
-                    self.wake_word_detector.resume()
+                # The server was already told to listen
+                await self.protocol.send_stop_listening()
+                self.set_device_state(DeviceState.IDLE)
+                self._wwd_resume_if_paused()
                 return
             # --- End force reinitialization ---
 
-            asyncio.run_coroutine_threadsafe(
-                self.protocol.send_start_listening(ListeningMode.MANUAL), self.loop
-            )
-            self.schedule(lambda: self.set_device_state(DeviceState.LISTENING))
+            self.set_device_state(DeviceState.LISTENING)
         elif self.device_state == DeviceState.SPEAKING:
             if not self.aborted:
                 self.abort_speaking(AbortReason.WAKE_WORD_DETECTED)
@@ -839,21 +923,21 @@ class Application:
     async def _open_audio_channel_and_start_manual_listening(self):
         """Open audio channel and start manual listening."""
         if not await self.protocol.open_audio_channel():
-            self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
+            self.schedule(self._set_idle)
             self.alert("Error", "Failed to open audio channel")
             return
 
         await self.protocol.send_start_listening(ListeningMode.MANUAL)
-        self.schedule(lambda: self.set_device_state(DeviceState.LISTENING))
+        self.schedule(self._set_listening)
 
     def toggle_chat_state(self):
         """Toggle chat state."""
         # Check if wake word detector exists
         if self.wake_word_detector:
             self.wake_word_detector.pause()
-        self.schedule(self._toggle_chat_state_impl)
+        self._submit(self._toggle_chat_state_impl())
 
-    def _toggle_chat_state_impl(self):
+    async def _toggle_chat_state_impl(self):
         """Implementation of toggle chat state."""
         # Check if protocol is initialized
         if not self.protocol:
@@ -862,65 +946,39 @@ class Application:
 
         # If device is in idle state, try to connect and start listening
         if self.device_state == DeviceState.IDLE:
-            self.schedule(
-                lambda: self.set_device_state(DeviceState.CONNECTING)
-            )  # Set device state to connecting
-
-            # Use thread to handle connection operation to avoid blocking
-            def connect_and_listen():
-                # Try to open audio channel
-                if not self.protocol.is_audio_channel_opened():
-                    try:
-                        # Wait for async operation to complete
-                        future = asyncio.run_coroutine_threadsafe(
-                            self.protocol.open_audio_channel(), self.loop
-                        )
-                        # Wait for operation to complete and get result, using shorter timeout
-                        try:
-                            success = future.result(timeout=5.0)
-                        except asyncio.TimeoutError:
-                            logger.error("Opening audio channel timed out")
-                            self.schedule(
-                                lambda: self.set_device_state(DeviceState.IDLE)
-                            )
-                            self.alert("Error", "Opening audio channel timed out")
-                            return
-                        except Exception as e:
-                            logger.error(f"Unknown error opening audio channel: {e}")
-                            self.schedule(
-                                lambda: self.set_device_state(DeviceState.IDLE)
-                            )
-                            self.alert("Error", f"Failed to open audio channel: {str(e)}")
-                            return
-
-                        if not success:
-                            self.alert("Error", "Failed to open audio channel")  # Show error alert
-                            self.schedule(
-                                lambda: self.set_device_state(DeviceState.IDLE)
-                            )
-                            return
+            self.set_device_state(DeviceState.CONNECTING)  # Set device state to connecting
 
-                    except Exception as e:
-                        logger.error(f"Error opening audio channel: {e}")
-                        self.alert("Error", f"Failed to open audio channel: {str(e)}")
-                        self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
-                        return
-
-                self.keep_listening = True  # Start listening
-                # Start auto-stop listening mode
+            # Try to open audio channel
+            if not self.protocol.is_audio_channel_opened():
                 try:
-                    asyncio.run_coroutine_threadsafe(
-                        self.protocol.send_start_listening(ListeningMode.AUTO_STOP),
-                        self.loop,
+                    success = await asyncio.wait_for(
+                        self.protocol.open_audio_channel(), timeout=5.0
                     )
-                    self.schedule(lambda: self.set_device_state(DeviceState.LISTENING))
+                except asyncio.TimeoutError:
+                    logger.error("Opening audio channel timed out")
+                    self.set_device_state(DeviceState.IDLE)
+                    self.alert("Error", "Opening audio channel timed out")
+                    return
                 except Exception as e:
-                    logger.error(f"Error starting listening: {e}")
+                    logger.error(f"Error opening audio channel: {e}")
+                    self.set_device_state(DeviceState.IDLE)
+                    self.alert("Error", f"Failed to open audio channel: {str(e)}")
+                    return
+
+                if not success:
+                    self.alert("Error", "Failed to open audio channel")  # Show error alert
                     self.set_device_state(DeviceState.IDLE)
-                    self.alert("Error", f"Failed to start listening: {str(e)}")
+                    return
 
-            # Start connection thread
-            threading.Thread(target=connect_and_listen, daemon=True).start()
+            self.keep_listening = True  # Start listening
+            # Start auto-stop listening mode
+            try:
+                await self.protocol.send_start_listening(ListeningMode.AUTO_STOP)
+                self.set_device_state(DeviceState.LISTENING)
+            except Exception as e:
+                logger.error(f"Error starting listening: {e}")
+                self.set_device_state(DeviceState.IDLE)
+                self.alert("Error", f"Failed to start listening: {str(e)}")
 
         # If device is speaking, stop current speech
         elif self.device_state == DeviceState.SPEAKING:
@@ -928,31 +986,20 @@ class Application:
 
         # If device is listening, close audio channel
         elif self.device_state == DeviceState.LISTENING:
-            # Use thread to handle close operation to avoid blocking
-            def close_audio_channel():
-                try:
-                    future = asyncio.run_coroutine_threadsafe(
-                        self.protocol.close_audio_channel(), self.loop
-                    )
-                    future.result(timeout=3.0)  # Use shorter timeout
-                except Exception as e:
-                    logger.error(f"Error closing audio channel: {e}")
-
-            threading.Thread(target=close_audio_channel, daemon=True).start()
+            # Close in the background; errors are logged by _spawn_task
+            self._spawn_task(self.protocol.close_audio_channel())
             # Set to idle state immediately, without waiting for close completion
-            self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
+            self.set_device_state(DeviceState.IDLE)
 
     def stop_listening(self):
         """Stop listening."""
-        self.schedule(self._stop_listening_impl)
+        self._submit(self._stop_listening_impl())
 
-    def _stop_listening_impl(self):
+    async def _stop_listening_impl(self):
         """Implementation of stop listening."""
         if self.device_state == DeviceState.LISTENING:
-            asyncio.run_coroutine_threadsafe(
-                self.protocol.send_stop_listening(), self.loop
-            )
             self.set_device_state(DeviceState.IDLE)
+            await self.protocol.send_stop_listening()
 
     def abort_speaking(self, reason):
         """Abort speech output."""
@@ -968,48 +1015,45 @@ class Application:
         self.set_is_tts_playing(False)
 
         # Clear audio queue immediately
-        if self.audio_codec:
-            self.audio_codec.clear_audio_queue()
+        codec = self.audio_codec
+        if codec:
+            codec.clear_audio_queue()
 
         # If aborted due to wake word, pause wake word detector to avoid Vosk assertion errors
-        if reason == AbortReason.WAKE_WORD_DETECTED and self.wake_word_detector:
-            if (
-                hasattr(self.wake_word_detector, "is_running")
-                and self.wake_word_detector.is_running()
-            ):
-                # Pause wake word detector
-                self.wake_word_detector.pause()
-                logger.debug("Temporarily pausing wake word detector to avoid concurrent processing")
-                # Short wait to ensure wake word detector has paused processing
-                time.sleep(0.1)
+        detector_paused = (
+            reason == AbortReason.WAKE_WORD_DETECTED and self._wwd_pause_if_running()
+        )
+        if detector_paused:
+            logger.debug("Temporarily pausing wake word detector to avoid concurrent processing")
 
-        # Use thread to handle state change and async operations to avoid blocking main thread
-        def process_abort():
-            # Send abort command first
-            try:
-                future = asyncio.run_coroutine_threadsafe(
-                    self.protocol.send_abort_speaking(reason), self.loop
-                )
-                # Use short timeout to avoid long blocking
-                future.result(timeout=1.0)
-            except Exception as e:
-                logger.error(f"Error sending abort command: {e}")
+        # Send the abort and switch state on the event loop, without blocking the caller
+        self._submit(self._process_abort(reason, detector_paused))
 
-            # Then set state
-            # self.set_device_state(DeviceState.IDLE)
-            self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
-            # If aborted due to wake word and auto-listening is enabled, enter recording mode automatically
-            if (
-                reason == AbortReason.WAKE_WORD_DETECTED
-                and self.keep_listening
-                and self.protocol.is_audio_channel_opened()
-            ):
-                # Short delay to ensure abort command is processed
-                time.sleep(0.1)  # Shorten delay time
-                self.schedule(lambda: self.toggle_chat_state())
+    async def _process_abort(self, reason, detector_paused=False):
+        """Send the abort command and return to idle (or keep listening)."""
+        wwd = self.wake_word_detector
+        if detector_paused and wwd is not None:
+            # Wait (at most 0.1s) until the detector thread has parked
+            await self.loop.run_in_executor(None, wwd.wait_paused, 0.1)
 
-        # Start processing thread
-        threading.Thread(target=process_abort, daemon=True).start()
+        # Send abort command first
+        try:
+            # Use short timeout to avoid long blocking
+            await asyncio.wait_for(self.protocol.send_abort_speaking(reason), 1.0)
+        except Exception as e:
+            logger.error(f"Error sending abort command: {e}")
+
+        # Then set state
+        self.set_device_state(DeviceState.IDLE)
+        # If aborted due to wake word and auto-listening is enabled, enter recording mode automatically
+        if (
+            reason == AbortReason.WAKE_WORD_DETECTED
+            and self.keep_listening
+            and self.protocol.is_audio_channel_opened()
+        ):
+            # Short delay to ensure abort command is processed
+            await asyncio.sleep(0.1)
+            self.toggle_chat_state()
 
     def alert(self, title, message):
         """Display warning message."""
@@ -1023,9 +1067,16 @@ class Application:
         self.on_state_changed_callbacks.append(callback)
 
     def shutdown(self):
-        """Shut down the application."""
+        """Shut down the application.
+
+        The SIGINT handler in main.py exits with os._exit() right after this
+        returns, so every resource that needs a graceful close (audio devices,
+        network connections, detectors) must be released here.
+        """
         logger.info("Shutting down application...")
         self.running = False
+        # Wake the main loop so it can observe running == False
+        self._event_q.put(None)
 
         # Close audio codec
         if self.audio_codec:
@@ -1045,10 +1096,16 @@ class Application:
         if self.loop_thread and self.loop_thread.is_alive():
             self.loop_thread.join(timeout=1.0)
 
+        # Drop queued blocking helpers; running ones finish on their own
+        self._bg_executor.shutdown(wait=False, cancel_futures=True)
+
         # Stop wake word detection
         if self.wake_word_detector:
             self.wake_word_detector.stop()
 
+        # Persist deferred config updates before the process exits
+        self.config.flush_config()
+
         # Stop VAD detector
         # if hasattr(self, 'vad_detector') and self.vad_detector:
         #     self.vad_detector.stop()
@@ -1083,7 +1140,7 @@ class Application:
             # If wake word detector is disabled (internal failure), update configuration
             if not getattr(self.wake_word_detector, "enabled", True):
                 logger.warning("Wake word detector is disabled (internal failure)")
-                self.config.update_config("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
+                self.config.update_config_deferred("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
                 self.wake_word_detector = None
                 return
 
@@ -1107,16 +1164,25 @@ class Application:
             logger.error(traceback.format_exc())
 
             # Disable wake word functionality but do not affect other program functions
-            self.config.update_config("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
+            self.config.update_config_deferred("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
             logger.info("Wake word functionality disabled due to initialization failure, but program will continue running")
             self.wake_word_detector = None
 
     def _handle_wake_word_error(self, error):
         """Handle wake word detector error."""
         logger.error(f"Wake word detection error: {error}")
-        # Try restarting detector
-        if self.device_state == DeviceState.IDLE:
-            self.schedule(lambda: self._restart_wake_word_detector())
+        # Try restarting detector, at most once per backoff window so an error
+        # burst (e.g. a device dropping out) does not queue a restart each
+        if self.device_state != DeviceState.IDLE:
+            return
+        now = time.monotonic()
+        if now - self._wwd_last_restart < self._wwd_restart_backoff:
+            return
+        self._wwd_last_restart = now
+        self._wwd_restart_backoff = min(
+            self._wwd_restart_backoff * 2, self.WWD_RESTART_BACKOFF_MAX
+        )
+        self._submit(self._restart_wake_word_detector())
 
     def _start_wake_word_detector(self):
         """Start wake word detector."""
@@ -1129,17 +1195,17 @@ class Application:
             success = self.wake_word_detector.start(self.audio_codec)
             if not success:
                 logger.error("Wake word detector failed to start, disabling wake word functionality")
-                self.config.update_config("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
+                self.config.update_config_deferred("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
                 self.wake_word_detector = None
         else:
             logger.error("Audio codec unavailable, unable to start wake word detector")
-            self.config.update_config("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
+            self.config.update_config_deferred("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
             self.wake_word_detector = None
 
     def _on_wake_word_detected(self, wake_word, full_text):
         """Wake word detection callback."""
         logger.info(f"Wake word detected: {wake_word} (full text: {full_text})")
-        self.schedule(lambda: self._handle_wake_word_detected(wake_word))
+        self.schedule(partial(self._handle_wake_word_detected, wake_word))
 
     def _handle_wake_word_detected(self, wake_word):
         """Handle wake word detection event."""
@@ -1149,11 +1215,9 @@ class Application:
                 self.wake_word_detector.pause()
 
             # Start connection and listening
-            self.schedule(lambda: self.set_device_state(DeviceState.CONNECTING))
+            self.schedule(self._set_connecting)
             # Try connecting and opening audio channel
-            asyncio.run_coroutine_threadsafe(
-                self._connect_and_start_listening(wake_word), self.loop
-            )
+            self._submit(self._connect_and_start_listening(wake_word))
         elif self.device_state == DeviceState.SPEAKING:
             self.abort_speaking(AbortReason.WAKE_WORD_DETECTED)
 
@@ -1163,75 +1227,83 @@ class Application:
         if not await self.protocol.connect():
             logger.error("Failed to connect to server")
             self.alert("Error", "Failed to connect to server")
-            self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
-            # Resume wake word detection
-            if self.wake_word_detector:
-                self.wake_word_detector.resume()
+            # Go idle and resume wake word detection
+            self.schedule_many(self._set_idle, self._wwd_resume_if_paused)
             return
 
         # Then try opening audio channel
         if not await self.protocol.open_audio_channel():
             logger.error("Failed to open audio channel")
-            self.schedule(lambda: self.set_device_state(DeviceState.IDLE))
+            self.schedule_many(self._set_idle, self._wwd_resume_if_paused)
             self.alert("Error", "Failed to open audio channel")
-            # Resume wake word detection
-            if self.wake_word_detector:
-                self.wake_word_detector.resume()
             return
 
         await self.protocol.send_wake_word_detected(wake_word)
         # Set to auto-listening mode
         self.keep_listening = True
         await self.protocol.send_start_listening(ListeningMode.AUTO_STOP)
-        self.schedule(lambda: self.set_device_state(DeviceState.LISTENING))
+        self.schedule(self._set_listening)
 
-    def _restart_wake_word_detector(self):
-        """Restart wake word detector (only supports AudioCodec shared stream mode)."""
+    async def _restart_wake_word_detector(self):
+        """Restart wake word detector (only supports AudioCodec shared stream mode).
+
+        stop() joins the detection thread, so it runs in the executor.
+        """
         logger.info("Attempting to restart wake word detector")
         try:
             # Stop existing detector
             if self.wake_word_detector:
-                self.wake_word_detector.stop()
-                time.sleep(0.5)  # Allow some time for resource release
+                await self.loop.run_in_executor(None, self.wake_word_detector.stop)
+                await asyncio.sleep(0.5)  # Allow some time for resource release
 
             # Require audio codec
             if hasattr(self, "audio_codec") and self.audio_codec:
-                success = self.wake_word_detector.start(self.audio_codec)
+                success = await self.loop.run_in_executor(
+                    None, self.wake_word_detector.start, self.audio_codec
+                )
                 if success:
+                    self._wwd_restart_backoff = self.WWD_RESTART_BACKOFF_MIN
                     logger.info("Wake word detector restarted successfully with audio codec")
                 else:
                     logger.error("Wake word detector restart failed, disabling wake word functionality")
-                    self.config.update_config("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
+                    self.config.update_config_deferred("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
                     self.wake_word_detector = None
             else:
                 logger.error("Audio codec unavailable, unable to restart wake word detector")
-                self.config.update_config("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
+                self.config.update_config_deferred("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
                 self.wake_word_detector = None
         except Exception as e:
             logger.error(f"Failed to restart wake word detector: {e}")
-            self.config.update_config("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
+            self.config.update_config_deferred("WAKE_WORD_OPTIONS.USE_WAKE_WORD", False)
             self.wake_word_detector = None
 
     def _initialize_iot_devices(self):
-        """Initialize IoT devices."""
-        from src.iot.thing_manager import ThingManager
-        from src.iot.things.CameraVL.Camera import Camera
+        """Initialize IoT devices.
 
+        Optional devices are imported only when enabled, so their dependency
+        chains (OpenCV for the camera, etc.) stay out of startup.
+        """
         # Import new countdown timer device
         from src.iot.things.countdown_timer import CountdownTimer
         from src.iot.things.lamp import Lamp
-        from src.iot.things.music_player import MusicPlayer
         from src.iot.things.speaker import Speaker
 
-        # Get IoT device manager instance
+        # Get IoT device manager instance, kept for the message handlers
         thing_manager = ThingManager.get_instance()
+        self._thing_manager = thing_manager
 
         # Add devices
         thing_manager.add_thing(Lamp())
         thing_manager.add_thing(Speaker())
-        thing_manager.add_thing(MusicPlayer())
-        # Default disabled for the following example
-        thing_manager.add_thing(Camera())
+        if self.config.get_config("MUSIC_PLAYER.ENABLED", True):
+            from src.iot.things.music_player import MusicPlayer
+
+            thing_manager.add_thing(MusicPlayer())
+        # Camera is opt-out: set CAMERA.ENABLED to false to skip it
+        if self.config.get_config("CAMERA.ENABLED", True):
+            from src.iot.things.CameraVL.Camera import Camera
+
+            thing_manager.add_thing(Camera())
 
         # Add countdown timer device
         thing_manager.add_thing(CountdownTimer())
@@ -1247,103 +1319,63 @@ class Application:
                 HomeAssistantSwitch,
             )
 
+            # Entity domain -> (device class, description for logging)
+            ha_dispatch = {
+                "light": (HomeAssistantLight, "light"),
+                "switch": (HomeAssistantSwitch, "switch"),
+                "number": (HomeAssistantNumber, "number"),
+                "button": (HomeAssistantButton, "button"),
+            }
+            ha_default = (HomeAssistantLight, "(default treated as light)")
+
             # Add Home Assistant devices
             ha_devices = self.config.get_config("HOME_ASSISTANT.DEVICES", [])
             for device in ha_devices:
                 entity_id = device.get("entity_id")
                 friendly_name = device.get("friendly_name")
-                if entity_id:
-                    # Determine device type based on entity ID
-                    if entity_id.startswith("light."):
-                        # Light device
-                        thing_manager.add_thing(
-                            HomeAssistantLight(entity_id, friendly_name)
-                        )
-                        logger.info(
-                            f"Added Home Assistant light device: {friendly_name or entity_id}"
-                        )
-                    elif entity_id.startswith("switch."):
-                        # Switch device
-                        thing_manager.add_thing(
-                            HomeAssistantSwitch(entity_id, friendly_name)
-                        )
-                        logger.info(
-                            f"Added Home Assistant switch device: {friendly_name or entity_id}"
-                        )
-                    elif entity_id.startswith("number."):
-                        # Number device (e.g., volume control)
-                        thing_manager.add_thing(
-                            HomeAssistantNumber(entity_id, friendly_name)
-                        )
-                        logger.info(
-                            f"Added Home Assistant number device: {friendly_name or entity_id}"
-                        )
-                    elif entity_id.startswith("button."):
-                        # Button device
-                        thing_manager.add_thing(
-                            HomeAssistantButton(entity_id, friendly_name)
-                        )
-                        logger.info(
-                            f"Added Home Assistant button device: {friendly_name or entity_id}"
-                        )
-                    else:
-                        # Default to light device
-                        thing_manager.add_thing(
-                            HomeAssistantLight(entity_id, friendly_name)
-                        )
-                        logger.info(
-                            f"Added Home Assistant device (default treated as light): {friendly_name or entity_id}"
-                        )
+                if not entity_id:
+                    continue
+                # Determine device type from the entity domain, default to light
+                domain = entity_id.split(".", 1)[0]
+                device_cls, kind = ha_dispatch.get(domain, ha_default)
+                thing_manager.add_thing(device_cls(entity_id, friendly_name))
+                logger.info(
+                    f"Added Home Assistant {kind} device: {friendly_name or entity_id}"
+                )
 
         logger.info("IoT devices initialization completed")
 
     def _handle_iot_message(self, data):
         """Handle IoT message."""
-        from src.iot.thing_manager import ThingManager
-
-        thing_manager = ThingManager.get_instance()
-
         commands = data.get("commands", [])
-        for command in commands:
-            try:
-                result = thing_manager.invoke(command)
-                logger.info(f"IoT command execution result: {result}")
-                # self.schedule(lambda: self._update_iot_states())
-            except Exception as e:
-                logger.error(f"Failed to execute IoT command: {e}")
+        if not commands:
+            return
 
-    def _update_iot_states(self, delta=None):
+        failed = 0
+        for command, result, error in self._thing_manager.invoke_batch(commands):
+            if error is not None:
+                failed += 1
+                logger.error(f"Failed to execute IoT command: {error}")
+            else:
+                logger.debug("IoT command execution result: %s", result)
+        logger.info(f"Executed {len(commands)} IoT command(s), {failed} failed")
+
+    async def _update_iot_states(self, delta=True):
         """Update IoT device states.
 
         Args:
             delta: Whether to send only changed parts
-                   - None: Use original behavior, always send all states
                    - True: Send only changed parts
                    - False: Send all states and reset cache
         """
-        from src.iot.thing_manager import ThingManager
-
-        thing_manager = ThingManager.get_instance()
+        thing_manager = self._thing_manager
 
-        # Handle backward compatibility
-        if delta is None:
-            # Maintain original behavior: get all states and send
-            states_json = thing_manager.get_states_json_str()  # Call old method
-
-            # Send state update
-            asyncio.run_coroutine_threadsafe(
-                self.protocol.send_iot_states(states_json), self.loop
-            )
-            logger.info("IoT device states updated")
-            return
-
-        # Use new method to get states
-        changed, states_json = thing_manager.get_states_json(delta=delta)
+        # The protocol embeds the list in its own message, so skip the
+        # intermediate JSON string (dumps here, loads again in the protocol)
+        changed, states = thing_manager.get_states(delta=delta)
         # delta=False always sends, delta=True sends only if changed
         if not delta or changed:
-            asyncio.run_coroutine_threadsafe(
-                self.protocol.send_iot_states(states_json), self.loop
-            )
+            await self.protocol.send_iot_states(states)
             if delta:
                 logger.info("IoT device states updated (incremental)")
             else:
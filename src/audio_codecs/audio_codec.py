@@ -1,8 +1,9 @@
-import queue
+import atexit
+import ctypes
+import logging
 import threading
 import time
 
-import numpy as np
 import opuslib
 import pyaudio
 
@@ -11,31 +12,255 @@ from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# OPUS_SIGNAL_VOICE from opus_defines.h (not exported by opuslib)
+OPUS_SIGNAL_VOICE = 3001
+
+
+class SpscRing:
+    """Fixed-size single-producer/single-consumer ring of Opus payloads.
+
+    Threading contract:
+    - push() is called from one producer thread (network receive) and is the
+      only writer of head and discard.
+    - pop() is called from one consumer thread (playback) and is the only
+      writer of tail.
+    - clear() may be called from any thread. It only writes cleared, which
+      nothing else writes; concurrent clear() calls are serialized by a lock.
+    Each of these is a plain int store, atomic under the GIL, so push() and
+    pop() take no lock. Readers treat max(tail, discard, cleared) as the
+    oldest live slot, so a drop in push() racing with clear() cannot bring
+    cleared items back. One slot is kept free so the producer never
+    overwrites the slot the consumer may be reading. When full, push() drops
+    the oldest frame.
+    """
+
+    def __init__(self, capacity):
+        slots = 1
+        while slots < capacity + 1:
+            slots <<= 1
+        self._buf = [None] * slots
+        self._mask = slots - 1
+        self.maxsize = slots - 1
+        self._head = 0  # next slot to write (producer)
+        self._tail = 0  # next slot to read (consumer)
+        self._discard = 0  # dropped by push() when full (producer)
+        self._cleared = 0  # dropped by clear() (any thread)
+        self._clear_lock = threading.Lock()
+
+    def _start(self):
+        return max(self._tail, self._discard, self._cleared)
+
+    def push(self, item):
+        """Append an item; return True if the oldest one had to be dropped."""
+        head = self._head
+        start = self._start()
+        dropped = head - start >= self.maxsize
+        if dropped:
+            self._discard = start + 1
+        self._buf[head & self._mask] = item
+        self._head = head + 1
+        return dropped
+
+    def pop(self):
+        """Remove and return the oldest item, or None if the ring is empty."""
+        while True:
+            tail = self._start()
+            if tail >= self._head:
+                self._tail = tail
+                return None
+            item = self._buf[tail & self._mask]
+            # Re-check: the item may have been dropped or cleared meanwhile
+            if self._discard <= tail and self._cleared <= tail:
+                self._tail = tail + 1
+                return item
+
+    def clear(self):
+        """Drop all queued items and return how many there were."""
+        with self._clear_lock:
+            head = self._head
+            count = head - self._start()
+            self._cleared = max(self._cleared, head)
+        return max(count, 0)
+
+    def qsize(self):
+        return max(self._head - self._start(), 0)
+
+    def empty(self):
+        return self.qsize() == 0
+
+
+class PcmRing:
+    """Fixed-size byte ring of decoded PCM between the decoder and the callback.
+
+    The decoder writes head, the output callback writes tail and clear()
+    writes discard (AudioCodec serializes clear() with _out_lock). Positions
+    are absolute byte counts masked into a power-of-two bytearray, so nothing
+    is allocated after construction apart from the bytes object PyAudio
+    requires back.
+    """
+
+    def __init__(self, capacity):
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._buf = bytearray(size)
+        self._view = memoryview(self._buf)
+        self._size = size
+        self._mask = size - 1
+        self._head = 0  # decoder
+        self._tail = 0  # output callback
+        self._discard = 0  # clear()
+        self._silence = b""
+
+    def buffered(self):
+        return max(self._head - max(self._tail, self._discard), 0)
+
+    def write(self, data, nbytes):
+        """Append nbytes from a byte-format buffer; the caller ensures room."""
+        start = self._head & self._mask
+        first = min(nbytes, self._size - start)
+        self._view[start : start + first] = data[:first]
+        if first < nbytes:
+            self._view[: nbytes - first] = data[first:nbytes]
+        self._head += nbytes
+
+    def read(self, nbytes):
+        """Return exactly nbytes, padding with silence when short.
+
+        Returns:
+            tuple: (bytes, number of real PCM bytes in it)
+        """
+        tail = max(self._tail, self._discard)
+        got = min(nbytes, max(self._head - tail, 0))
+        if got == 0:
+            if len(self._silence) != nbytes:
+                self._silence = bytes(nbytes)
+            self._tail = tail
+            return self._silence, 0
+
+        start = tail & self._mask
+        end = start + got
+        if end <= self._size:
+            data = self._view[start:end].tobytes()
+        else:
+            data = self._view[start:].tobytes() + self._view[: end - self._size]
+        self._tail = tail + got
+        if got < nbytes:
+            data += bytes(nbytes - got)
+        return data, got
+
+    def clear(self):
+        self._discard = max(self._discard, self._head)
+
 
 class AudioCodec:
     """Audio codec class for handling audio recording and playback (strict compatibility version)"""
 
+    # Audio buffered before playback starts, to ride out network jitter
+    MIN_START_MS = 200
+    # Frames decoded per play_audio() call
+    PLAY_BATCH_FRAMES = 5
+    # Decoded audio kept ready for the output callback
+    PCM_BUFFER_MS = 200
+    # Minimum spacing between reinitializations of the same stream
+    REINIT_INTERVAL = 0.5
+
     def __init__(self):
         self.audio = None
         self.input_stream = None
         self.output_stream = None
         self.opus_encoder = None
         self.opus_decoder = None
+        # Hot-path constants (read_audio / play_audio / output callback)
+        self._in_fs = AudioConfig.INPUT_FRAME_SIZE
+        self._out_fs = AudioConfig.OUTPUT_FRAME_SIZE
+        self._frame_bytes = AudioConfig.CHANNELS * 2  # bytes per int16 frame
+        self._in_bytes = self._in_fs * self._frame_bytes
+        # Persistent packet buffer the encoder writes into (same bound as opuslib)
+        self._encode_buf = (ctypes.c_char * self._in_bytes)()
+        # Persistent PCM buffer the decoder writes a batch of frames into
+        self._decode_capacity = AudioConfig.OUTPUT_FRAME_SIZE * self.PLAY_BATCH_FRAMES
+        self._decode_buf = (
+            ctypes.c_int16 * (self._decode_capacity * AudioConfig.CHANNELS)
+        )()
+        self._decode_addr = ctypes.addressof(self._decode_buf)
+        self._decode_view = memoryview(self._decode_buf).cast("B")
+        # Decoded PCM handed from the playback thread to the output callback
+        self._pcm_high_water = (
+            AudioConfig.OUTPUT_SAMPLE_RATE
+            * self.PCM_BUFFER_MS
+            // 1000
+            * AudioConfig.CHANNELS
+            * 2
+        )
+        # Room for the high-water mark plus one full decode batch
+        self._pcm_ring = PcmRing(
+            self._pcm_high_water + self._decode_capacity * AudioConfig.CHANNELS * 2
+        )
+        # Bumped by clear_audio_queue(); a batch decoded across it is dropped
+        self._play_generation = 0
+        self._decoding = False
+        self._underflow_logged = False
+        # The callback has been playing decoded PCM since the last underrun
+        self._pcm_playing = False
         # Set maximum queue size to prevent memory overflow (approximately 10 seconds of audio buffer)
         max_queue_size = int(10 * 1000 / AudioConfig.FRAME_DURATION)
-        self.audio_decode_queue = queue.Queue(maxsize=max_queue_size)
+        self.audio_decode_queue = SpscRing(max_queue_size)
+        # Set whenever the playback queue has been fully written to the device
+        self.drain_event = threading.Event()
+        self.drain_event.set()
+        # Playback waits until MIN_START_MS of audio is queued (or prime_playback())
+        self._min_start_frames = max(1, self.MIN_START_MS // AudioConfig.FRAME_DURATION)
+        self._playback_primed = False
+        # Playback thread, woken through the condition whenever audio arrives
+        self._play_cv = threading.Condition()
+        self._playback_thread = None
 
         # State management (retaining original variable names)
         self._is_closing = False
         self._is_input_paused = False
         self._input_paused_lock = threading.Lock()
-        self._stream_lock = threading.Lock()
+        # One lock per direction so capture and playback never wait on each
+        # other; code needing both takes _in_lock before _out_lock
+        self._in_lock = threading.Lock()
+        self._out_lock = threading.Lock()
+        # Last known running state of each stream, so the per-frame paths do
+        # not call into PortAudio; only this class stops streams, so a stale
+        # False is re-checked with is_active() before reinitializing
+        self._input_active = False
+        self._output_active = False
+        # Input backlog (in samples) at which read_audio() trims latency
+        self._drop_threshold = self._in_fs * 2
+        # time.monotonic() of the last reinitialization, per stream type
+        self._last_reinit_ts = {"input": 0.0, "output": 0.0}
+
+        # Stream parameters are fixed, so build the open() arguments once
+        self._in_kwargs = {
+            "format": pyaudio.paInt16,
+            "channels": AudioConfig.CHANNELS,
+            "rate": AudioConfig.INPUT_SAMPLE_RATE,
+            "input": True,
+            "frames_per_buffer": AudioConfig.INPUT_FRAME_SIZE,
+            "start": False,
+        }
+        self._out_kwargs = {
+            "format": pyaudio.paInt16,
+            "channels": AudioConfig.CHANNELS,
+            "rate": AudioConfig.OUTPUT_SAMPLE_RATE,
+            "output": True,
+            "frames_per_buffer": AudioConfig.OUTPUT_FRAME_SIZE,
+            "start": False,
+            # Output is pulled by PortAudio's audio thread
+            "stream_callback": self._output_callback,
+        }
 
         # Device index cache removed (not used)
 
         self._initialize_audio()
 
     def _initialize_audio(self):
+        # Checked once so per-frame debug logging costs nothing when disabled
+        self._debug = logger.isEnabledFor(logging.DEBUG)
         try:
             self.audio = pyaudio.PyAudio()
 
@@ -47,51 +272,171 @@ class AudioCodec:
             self.opus_encoder = opuslib.Encoder(
                 AudioConfig.INPUT_SAMPLE_RATE,
                 AudioConfig.CHANNELS,
-                opuslib.APPLICATION_AUDIO,
+                opuslib.APPLICATION_VOIP,
             )
+            self._configure_encoder()
             self.opus_decoder = opuslib.Decoder(
                 AudioConfig.OUTPUT_SAMPLE_RATE, AudioConfig.CHANNELS
             )
 
+            self._playback_thread = threading.Thread(
+                target=self._playback_loop, name="AudioPlayback", daemon=True
+            )
+            self._playback_thread.start()
+
+            # Safety net for owners that never call close()
+            atexit.register(self.close)
+
             logger.info("Audio device and codec initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize audio device: {e}")
             self.close()
             raise
 
+    def _configure_encoder(self):
+        """Tune the encoder for speech.
+
+        DTX lets the encoder emit tiny frames during silence, and the voice
+        signal hint skips music/speech detection; both cut encode CPU on the
+        microphone path, which is mostly silence while listening.
+        """
+        try:
+            state = self.opus_encoder.encoder_state
+            opuslib.api.encoder.encoder_ctl(state, opuslib.api.ctl.set_dtx, 1)
+            opuslib.api.encoder.encoder_ctl(
+                state, opuslib.api.ctl.set_signal, OPUS_SIGNAL_VOICE
+            )
+        except Exception as e:
+            # Encoder still works with default settings
+            logger.warning(f"Failed to configure Opus encoder: {e}")
+
+    def _encode_frame(self, pcm):
+        """Encode one captured frame into the persistent packet buffer.
+
+        Calls libopus directly: opuslib's Encoder.encode allocates a packet
+        buffer, slices it and copies it through array.array for every frame.
+        PyAudio cannot read into a caller buffer, so the captured bytes are
+        passed through as-is and only the final packet is copied out.
+        """
+        size = opuslib.api.encoder.libopus_encode(
+            self.opus_encoder.encoder_state,
+            ctypes.cast(pcm, ctypes.POINTER(ctypes.c_int16)),
+            self._in_fs,
+            self._encode_buf,
+            self._in_bytes,
+        )
+        if size < 0:
+            raise opuslib.OpusError(size)
+        return ctypes.string_at(self._encode_buf, size)
+
+    def _decode_frame(self, opus_data, offset=0):
+        """Decode one Opus frame into the persistent buffer at `offset`.
+
+        Calls libopus directly so the decoder does not allocate a fresh ctypes
+        array (plus an array.array copy) for every frame.
+
+        Args:
+            opus_data: Encoded frame
+            offset: Samples per channel already in self._decode_buf
+
+        Returns:
+            int: Number of samples per channel decoded
+        """
+        pcm_ptr = ctypes.cast(
+            self._decode_addr + offset * self._frame_bytes,
+            ctypes.POINTER(ctypes.c_int16),
+        )
+        samples = opuslib.api.decoder.libopus_decode(
+            self.opus_decoder.decoder_state,
+            opus_data,
+            len(opus_data),
+            pcm_ptr,
+            self._decode_capacity - offset,
+            0,
+        )
+        if samples < 0:
+            raise opuslib.OpusError(samples)
+        return samples
+
+    def _output_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio output callback: hand over the next frame_count frames.
+
+        Runs on PortAudio's audio thread. It never blocks; when the decoder
+        has nothing ready it plays silence instead of reopening the stream.
+        """
+        nbytes = frame_count * self._frame_bytes
+        data, got = self._pcm_ring.read(nbytes)
+        if got:
+            self._pcm_playing = True
+        if got < nbytes and self._pcm_playing:
+            # Underrun or end of speech: pre-buffer the next burst again
+            self._pcm_playing = False
+            self._playback_primed = False
+        if got == 0 and self._audio_drained() and not self.drain_event.is_set():
+            self.drain_event.set()
+        if status & pyaudio.paOutputUnderflow:
+            if not self._underflow_logged:
+                self._underflow_logged = True
+                logger.warning("Audio output underflow, playing silence")
+        else:
+            self._underflow_logged = False
+
+        return data, pyaudio.paContinue
+
+    def _audio_drained(self):
+        """No queued, decoding or decoded-but-unplayed audio is left."""
+        return (
+            not self._decoding
+            and self._pcm_ring.buffered() == 0
+            and self.audio_decode_queue.empty()
+        )
+
     def _create_stream(self, is_input=True):
         """Stream creation logic."""
-        params = {
-            "format": pyaudio.paInt16,
-            "channels": AudioConfig.CHANNELS,
-            "rate": (
-                AudioConfig.INPUT_SAMPLE_RATE
-                if is_input
-                else AudioConfig.OUTPUT_SAMPLE_RATE
-            ),
-            "input" if is_input else "output": True,
-            "frames_per_buffer": (
-                AudioConfig.INPUT_FRAME_SIZE
-                if is_input
-                else AudioConfig.OUTPUT_FRAME_SIZE
-            ),
-            "start": False,
-        }
-
-        return self.audio.open(**params)
+        return self.audio.open(**(self._in_kwargs if is_input else self._out_kwargs))
 
     def _reinitialize_stream(self, is_input=True):
-        """General stream reinitialization method."""
+        """General stream reinitialization method.
+
+        Restarts the existing stream first and only closes and reopens it
+        when that fails; attempts within REINIT_INTERVAL are skipped so
+        repeated errors do not stack up slow device reopens.
+        """
         if self._is_closing:
             return False if is_input else None
 
-        try:
-            stream_attr = "input_stream" if is_input else "output_stream"
-            current_stream = getattr(self, stream_attr)
+        stream_type = "input" if is_input else "output"
+        now = time.monotonic()
+        if now - self._last_reinit_ts[stream_type] < self.REINIT_INTERVAL:
+            logger.warning(
+                f"Skipping {stream_type} stream reinitialization (rate limited)"
+            )
+            return False if is_input else None
+        self._last_reinit_ts[stream_type] = now
 
+        stream_attr = "input_stream" if is_input else "output_stream"
+        active_attr = "_input_active" if is_input else "_output_active"
+        setattr(self, active_attr, False)
+        if not is_input:
+            # Build up headroom again before writing to the stream
+            self._playback_primed = False
+
+        current_stream = getattr(self, stream_attr)
+        if current_stream:
+            try:
+                current_stream.stop_stream()
+                current_stream.start_stream()
+                setattr(self, active_attr, True)
+                logger.info(f"Audio {stream_type} stream restarted successfully")
+                return True if is_input else None
+            except Exception as e:
+                logger.warning(
+                    f"Failed to restart {stream_type} stream, reopening: {e}"
+                )
+
+        try:
             if current_stream:
                 try:
-                    current_stream.stop_stream()
                     current_stream.close()
                 except Exception:
                     pass
@@ -99,12 +444,11 @@ class AudioCodec:
             new_stream = self._create_stream(is_input=is_input)
             setattr(self, stream_attr, new_stream)
             new_stream.start_stream()
+            setattr(self, active_attr, True)
 
-            stream_type = "input" if is_input else "output"
             logger.info(f"Audio {stream_type} stream reinitialized successfully")
             return True if is_input else None
         except Exception as e:
-            stream_type = "input" if is_input else "output"
             logger.error(f"Failed to reinitialize {stream_type} stream: {e}")
             if is_input:
                 return False
@@ -131,87 +475,145 @@ class AudioCodec:
             return None
 
         try:
-            with self._stream_lock:
-                # Stream status check optimization
-                if not self.input_stream or not self.input_stream.is_active():
-                    if not self._reinitialize_stream(is_input=True):
+            with self._in_lock:
+                # Stream status check optimization (cached between frames)
+                if not self._input_active:
+                    if self.input_stream and self.input_stream.is_active():
+                        self._input_active = True
+                    elif not self._reinitialize_stream(is_input=True):
                         return None
 
-                # Dynamic buffer adjustment - real-time performance optimization
+                # Latency trim: with two or more frames backed up, drop all but
+                # the frame read below (integer arithmetic only)
                 available = self.input_stream.get_read_available()
-                if available > AudioConfig.INPUT_FRAME_SIZE * 2:  # Lower threshold from 3x to 2x
-                    skip_samples = available - (
-                        AudioConfig.INPUT_FRAME_SIZE * 1.5
-                    )  # Reduce retention amount
-                    if skip_samples > 0:  # Add safety check
-                        self.input_stream.read(
-                            int(skip_samples), exception_on_overflow=False  # Ensure integer
+                if available >= self._drop_threshold:
+                    skip_samples = available - self._in_fs
+                    self.input_stream.read(skip_samples, exception_on_overflow=False)
+                    if self._debug:
+                        logger.debug(
+                            f"Skipped {skip_samples} samples to reduce latency"
                         )
-                        logger.debug(f"Skipped {skip_samples} samples to reduce latency")
 
                 # Read data
-                data = self.input_stream.read(
-                    AudioConfig.INPUT_FRAME_SIZE, exception_on_overflow=False
-                )
+                data = self.input_stream.read(self._in_fs, exception_on_overflow=False)
 
                 # Data validation
-                if len(data) != AudioConfig.INPUT_FRAME_SIZE * 2:
+                if len(data) != self._in_bytes:
                     logger.warning("Abnormal audio data length, resetting input stream")
                     self._reinitialize_stream(is_input=True)
                     return None
 
-                return self.opus_encoder.encode(data, AudioConfig.INPUT_FRAME_SIZE)
+                return self._encode_frame(data)
 
         except Exception as e:
             logger.error(f"Failed to read audio: {e}")
             self._reinitialize_stream(is_input=True)
             return None
 
+    def prime_playback(self):
+        """Start playback without waiting for MIN_START_MS of buffered audio.
+
+        Used when no more audio is coming (e.g. TTS stop), so short clips
+        are not held back.
+        """
+        self._playback_primed = True
+        with self._play_cv:
+            self._play_cv.notify()
+
+    def is_playback_primed(self):
+        return self._playback_primed
+
+    def _has_playable_audio(self):
+        if self._is_closing:
+            return True
+        queued = self.audio_decode_queue.qsize()
+        return queued > 0 and (
+            self._playback_primed or queued >= self._min_start_frames
+        )
+
+    def _playback_loop(self):
+        """Playback thread: sleep until audio is ready, then decode and play it.
+
+        Decoding here overlaps with network receive on the event loop, and
+        there is no polling interval between a frame arriving and playback.
+        """
+        play_cv = self._play_cv
+        frame_seconds = AudioConfig.FRAME_DURATION / 1000
+        while not self._is_closing:
+            with play_cv:
+                play_cv.wait_for(self._has_playable_audio)
+                if self._pcm_ring.buffered() >= self._pcm_high_water:
+                    # Enough is decoded ahead of the callback; let it catch up
+                    play_cv.wait(frame_seconds)
+                    continue
+            if self._is_closing:
+                break
+            self.play_audio()
+
+    def _ensure_output_active(self):
+        """Start the output stream if it is stopped, reopening it on failure."""
+        if self._output_active:
+            return
+        output_stream = self.output_stream
+        if output_stream and output_stream.is_active():
+            self._output_active = True
+        elif output_stream:
+            try:
+                output_stream.start_stream()
+                self._output_active = True
+            except Exception as e:
+                logger.warning(
+                    f"Failed to start output stream, attempting reinitialization: {e}"
+                )
+                self._reinitialize_stream(is_input=False)
+
     def play_audio(self):
-        """Play audio (simplified version, discard on decode failure)"""
+        """Decode queued audio for the output callback (discard on decode failure)
+
+        Called from the playback thread.
+        """
         try:
             if self.audio_decode_queue.empty():
                 return
 
-            # Process audio data one by one, discard on failure
-            processed_count = 0
-            max_process_per_call = 5  # Limit the number of frames processed per call to avoid blocking
+            # Pre-buffer so the first writes have headroom against jitter
+            if not self._playback_primed:
+                if self.audio_decode_queue.qsize() < self._min_start_frames:
+                    return
+                self._playback_primed = True
 
-            while (
-                not self.audio_decode_queue.empty()
-                and processed_count < max_process_per_call
-            ):
-                try:
-                    opus_data = self.audio_decode_queue.get_nowait()
+            with self._out_lock:
+                self._ensure_output_active()
 
-                    # Decode audio data, discard on failure
+            # Decode a batch of frames back to back into the buffer, skipping
+            # (discarding) frames that fail, then copy them into the PCM ring
+            generation = self._play_generation
+            self._decoding = True
+            try:
+                decoded = 0
+                frame_size = self._out_fs
+                for _ in range(self.PLAY_BATCH_FRAMES):
+                    if decoded + frame_size > self._decode_capacity:
+                        break
+                    opus_data = self.audio_decode_queue.pop()
+                    if opus_data is None:
+                        break
                     try:
-                        pcm = self.opus_decoder.decode(
-                            opus_data, AudioConfig.OUTPUT_FRAME_SIZE
-                        )
+                        decoded += self._decode_frame(opus_data, decoded)
                     except opuslib.OpusError as e:
                         logger.warning(f"Audio decoding failed, discarding frame: {e}")
-                        processed_count += 1
-                        continue
 
-                    # Play audio data, discard on failure
-                    try:
-                        with self._stream_lock:
-                            if self.output_stream and self.output_stream.is_active():
-                                self.output_stream.write(
-                                    np.frombuffer(pcm, dtype=np.int16).tobytes()
-                                )
-                            else:
-                                logger.warning("Output stream not active, discarding frame")
-                    except OSError as e:
-                        logger.warning(f"Audio playback failed, discarding frame: {e}")
-                        if "Stream closed" in str(e):
-                            self._reinitialize_stream(is_input=False)
-
-                    processed_count += 1
-
-                except queue.Empty:
-                    break
+                # Skip the batch if the queue was cleared while decoding
+                if decoded:
+                    with self._out_lock:
+                        if generation == self._play_generation:
+                            self._pcm_ring.write(
+                                self._decode_view, decoded * self._frame_bytes
+                            )
+            finally:
+                self._decoding = False
+            # The gate is re-armed by the output callback once the PCM ring
+            # actually runs dry, not when the packet queue does
 
         except Exception as e:
             logger.error(f"Unexpected error during audio playback: {e}")
@@ -222,14 +624,28 @@ class AudioCodec:
             return
 
         self._is_closing = True
+        atexit.unregister(self.close)
         logger.info("Starting to close audio codec...")
 
         try:
             # Clear queue first
             self.clear_audio_queue()
 
+            # Stop the playback thread before its stream goes away
+            with self._play_cv:
+                self._play_cv.notify()
+            playback_thread = self._playback_thread
+            if (
+                playback_thread
+                and playback_thread.is_alive()
+                and playback_thread is not threading.current_thread()
+            ):
+                playback_thread.join(timeout=1.0)
+
             # Safely stop and close streams
-            with self._stream_lock:
+            with self._in_lock, self._out_lock:
+                self._input_active = False
+                self._output_active = False
                 # Close input stream first
                 if self.input_stream:
                     try:
@@ -278,18 +694,14 @@ class AudioCodec:
 
     def write_audio(self, opus_data):
         """Write Opus data to playback queue, handling queue full scenarios."""
-        try:
-            # Non-blocking queue insertion
-            self.audio_decode_queue.put_nowait(opus_data)
-        except queue.Full:
-            # If queue is full, remove oldest data and add new data
+        # Lock-free insertion; a full ring drops its oldest frame
+        if self.audio_decode_queue.push(opus_data):
             logger.warning("Audio playback queue is full, discarding oldest audio frame")
-            try:
-                self.audio_decode_queue.get_nowait()  # Remove oldest
-                self.audio_decode_queue.put_nowait(opus_data)  # Add new
-            except queue.Empty:
-                # If queue suddenly becomes empty, add directly
-                self.audio_decode_queue.put_nowait(opus_data)
+        # Cleared after the push so the output callback, which sets it once
+        # everything is played, cannot see an empty queue in between
+        self.drain_event.clear()
+        with self._play_cv:
+            self._play_cv.notify()
 
     # has_pending_audio method removed (can directly use not audio_decode_queue.empty())
 
@@ -305,23 +717,19 @@ class AudioCodec:
 
     def wait_for_audio_complete(self, timeout=5.0):
         """Wait for audio playback to complete (simplified version)"""
-        start = time.time()
-        while not self.audio_decode_queue.empty() and time.time() - start < timeout:
-            time.sleep(0.1)
-
-        if not self.audio_decode_queue.empty():
+        # Set by the output callback once everything queued has been played
+        if not self.drain_event.wait(timeout):
             remaining = self.audio_decode_queue.qsize()
             logger.warning(f"Audio playback timed out, remaining queue: {remaining} frames")
 
     def clear_audio_queue(self):
-        with self._stream_lock:
-            cleared_count = 0
-            while not self.audio_decode_queue.empty():
-                try:
-                    self.audio_decode_queue.get_nowait()
-                    cleared_count += 1
-                except queue.Empty:
-                    break
+        with self._out_lock:
+            cleared_count = self.audio_decode_queue.clear()
+            self._play_generation += 1
+            self._pcm_ring.clear()
+            self._pcm_playing = False
+            self._playback_primed = False
+            self.drain_event.set()
             if cleared_count > 0:
                 logger.info(f"Cleared audio queue, discarded {cleared_count} audio frames")
 
@@ -329,7 +737,9 @@ class AudioCodec:
 
     def stop_streams(self):
         """Safely stop streams (optimized error handling)"""
-        with self._stream_lock:
+        with self._in_lock, self._out_lock:
+            self._input_active = False
+            self._output_active = False
             for name, stream in [
                 ("input", self.input_stream),
                 ("output", self.output_stream),
@@ -343,5 +753,8 @@ class AudioCodec:
                         # Use warning level since this is not a critical error
                         logger.warning(f"Failed to stop {name} stream: {e}")
 
-    def __del__(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         self.close()
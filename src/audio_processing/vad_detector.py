@@ -1,6 +1,7 @@
 import logging
 import threading
 import time
+from functools import partial
 
 import numpy as np
 import pyaudio
@@ -264,5 +265,5 @@ class VADDetector:
         """触发打断."""
         # 通知应用程序中止当前语音输出
         self.app.schedule(
-            lambda: self.app.abort_speaking(AbortReason.WAKE_WORD_DETECTED)
+            partial(self.app.abort_speaking, AbortReason.WAKE_WORD_DETECTED)
         )
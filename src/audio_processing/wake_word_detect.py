@@ -28,6 +28,8 @@ class WakeWordDetector:
         self.running = False
         self.detection_thread = None
         self.paused = False
+        # 检测线程在暂停状态下空转时置位，表示当前没有正在处理的音频
+        self.paused_event = threading.Event()
         self.stream = None
         self.external_stream = False
         self.stream_lock = threading.Lock()
@@ -195,8 +197,10 @@ class WakeWordDetector:
         while self.running:
             try:
                 if self.paused:
+                    self.paused_event.set()
                     time.sleep(0.1)
                     continue
+                self.paused_event.clear()
 
                 # 获取音频流
                 stream = self._get_active_stream()
@@ -494,8 +498,19 @@ class WakeWordDetector:
     def resume(self):
         """恢复检测."""
         if self.running and self.paused:
+            self.paused_event.clear()
             self.paused = False
 
+    def wait_paused(self, timeout=None):
+        """等待检测线程进入暂停状态.
+
+        Returns:
+            bool: 检测线程已停在暂停状态(或未在运行)返回True，超时返回False
+        """
+        if not self.running or not self.detection_thread:
+            return True
+        return self.paused_event.wait(timeout)
+
     def on_detected(self, callback):
         """注册回调."""
         self.on_detected_callbacks.append(callback)
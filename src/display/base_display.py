@@ -1,4 +1,5 @@
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Callable, Optional
 
@@ -10,6 +11,9 @@ class BaseDisplay(ABC):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.current_volume = 70  # Default volume value
         self.volume_controller = None
+        # Reading the system mixer is slow; reuse a reading for this long
+        self._vol_cache_ts = 0.0
+        self._vol_cache_ttl = 0.2
 
         # Check volume control dependencies
         try:
@@ -21,6 +25,7 @@ class BaseDisplay(ABC):
                 # Read current system volume
                 try:
                     self.current_volume = self.volume_controller.get_volume()
+                    self._vol_cache_ts = time.monotonic()
                     self.logger.info(f"Read system volume: {self.current_volume}%")
                 except Exception as e:
                     self.logger.warning(
@@ -62,12 +67,26 @@ class BaseDisplay(ABC):
     def update_emotion(self, emotion: str):
         """Update emotion."""
 
+    def update_state(self, status: str, emotion: Optional[str] = None):
+        """Update status text and, if given, emotion for a device state change.
+
+        Displays that marshal updates to a UI thread can override this to
+        apply both in a single dispatch.
+        """
+        self.update_status(status)
+        if emotion is not None:
+            self.update_emotion(emotion)
+
     def get_current_volume(self):
         """Get current volume."""
         if self.volume_controller:
+            now = time.monotonic()
+            if now - self._vol_cache_ts < self._vol_cache_ttl:
+                return self.current_volume
             try:
                 # Get the latest volume from the system
                 self.current_volume = self.volume_controller.get_volume()
+                self._vol_cache_ts = now
                 # Successfully retrieved, mark volume controller as working
                 if hasattr(self, "volume_controller_failed"):
                     self.volume_controller_failed = False
@@ -90,6 +109,8 @@ class BaseDisplay(ABC):
         if self.volume_controller:
             try:
                 self.volume_controller.set_volume(volume)
+                # The value just set is current; no need to read it back
+                self._vol_cache_ts = time.monotonic()
                 self.logger.debug(f"System volume set to: {volume}%")
             except Exception as e:
                 self.logger.warning(f"Failed to set system volume: {e}")
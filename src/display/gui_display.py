@@ -1,23 +1,28 @@
 import logging
 import os
 import platform
-import queue
+import subprocess
 import sys
 import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Callable, Optional
 from urllib.parse import urlparse
 
 from PyQt5.QtCore import (
-    Q_ARG,
+    QBuffer,
     QEvent,
+    QIODevice,
     QMetaObject,
     QObject,
     QPropertyAnimation,
+    QRunnable,
     Qt,
     QThread,
+    QThreadPool,
     QTimer,
+    pyqtSignal,
     pyqtSlot,
 )
 from PyQt5.QtGui import (
@@ -56,6 +61,7 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
+from src.constants.constants import DeviceState
 from src.utils.config_manager import ConfigManager
 
 # Handle pynput import based on operating system
@@ -77,8 +83,24 @@ from src.display.base_display import BaseDisplay
 def restart_program():
     """Restart the current Python program, supporting packaged environments."""
     try:
-        python = sys.executable
-        print(f"Attempting to restart with command: {python} {sys.argv}")
+        frozen = getattr(sys, "frozen", False)
+        executable = os.path.abspath(sys.executable)
+        main_spec = getattr(sys.modules.get("__main__"), "__spec__", None)
+        if frozen:
+            # A packaged executable takes the arguments directly
+            argv = [executable, *sys.argv[1:]]
+        elif main_spec is not None:
+            # Launched with "python -m src": sys.argv[0] is src/__main__.py,
+            # which cannot import the src package when run as a script
+            module = main_spec.name.removesuffix(".__main__")
+            argv = [executable, "-m", module, *sys.argv[1:]]
+        else:
+            # Re-run the interpreter on the same script
+            argv = [executable, *sys.argv]
+        print(f"Attempting to restart with command: {argv}")
+
+        # os.execv skips atexit handlers, so write deferred config updates now
+        ConfigManager.get_instance().flush_config()
 
         # Attempt to close Qt application, although execv will take over, this is more proper
         app = QApplication.instance()
@@ -86,28 +108,24 @@ def restart_program():
             app.quit()
 
         # Use different restart methods in packaged environments
-        if getattr(sys, "frozen", False):
+        if frozen:
             # In packaged environment, use subprocess to start a new process
-            import subprocess
-
-            # Build complete command line
             if sys.platform.startswith("win"):
                 # Windows: Use detached to create an independent process
-                executable = os.path.abspath(sys.executable)
                 subprocess.Popen(
-                    [executable] + sys.argv[1:],
+                    argv,
+                    close_fds=True,
                     creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
                 )
             else:
                 # Linux/Mac
-                executable = os.path.abspath(sys.executable)
-                subprocess.Popen([executable] + sys.argv[1:], start_new_session=True)
+                subprocess.Popen(argv, start_new_session=True)
 
             # Exit current process
             sys.exit(0)
         else:
             # Non-packaged environment, use os.execv
-            os.execv(python, [python] + sys.argv)
+            os.execv(argv[0], argv)
     except Exception as e:
         print(f"Failed to restart program: {e}")
         logging.getLogger("Display").error(f"Failed to restart program: {e}", exc_info=True)
@@ -115,12 +133,58 @@ def restart_program():
         sys.exit(1)  # Or display an error message box
 
 
+# Bits for the keys the shortcuts use; other keys are not tracked
+_KEY_BITS = {"alt": 1, "shift": 2, "v": 4, "a": 8, "x": 16, "m": 32}
+_COMBO_TALK = 1 | 2 | 4  # Alt+Shift+V
+_COMBO_AUTO = 1 | 2 | 8  # Alt+Shift+A
+_COMBO_ABORT = 1 | 2 | 16  # Alt+Shift+X
+_COMBO_MODE = 1 | 2 | 32  # Alt+Shift+M
+
+# Event constants used by eventFilter, resolved once
+_MOUSE_PRESS = int(QEvent.MouseButtonPress)
+_LEFT_BUTTON = int(Qt.LeftButton)
+
+
 # Create compatible metaclass
 class CombinedMeta(type(QObject), ABCMeta):
     pass
 
 
+class _GifLoader(QRunnable):
+    """Read a GIF file on a pool thread and pass its bytes to the GUI thread.
+
+    The QMovie itself is built on the GUI thread (in the slot connected to
+    `loaded`), since QObjects belong to the thread that creates them.
+    """
+
+    def __init__(self, gif_path, loaded):
+        super().__init__()
+        self._gif_path = gif_path
+        self._loaded = loaded
+
+    def run(self):
+        try:
+            with open(self._gif_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            data = b""
+        self._loaded.emit(self._gif_path, data)
+
+
 class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
+    # Emotion animations kept loaded (each QMovie holds all decoded frames)
+    GIF_CACHE_SIZE = 16
+
+    # (gif_path, file bytes) from _GifLoader, delivered on the GUI thread
+    _gif_loaded = pyqtSignal(str, object)
+
+    # Navigation tab index -> routeKey
+    _INDEX_TO_ROUTEKEY = {
+        0: "mainInterface",
+        1: "iotInterface",
+        2: "settingInterface",
+    }
+
     def __init__(self):
         # Important: Call super() to handle multiple inheritance
         super().__init__()
@@ -149,9 +213,18 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         self.emotion_movie = None
         # Add variables related to emotion animation effects
         self.emotion_effect = None  # Emotion opacity effect
-        self.emotion_animation = None  # Emotion animation object
+        # Fade animations, created once with emotion_effect and reused
+        self._fade_out = None
+        self._fade_in = None
+        self._fade_target = None  # (label, gif_path) being switched to
         self.next_emotion_path = None  # Next emotion to display
         self.is_emotion_animating = False  # Whether emotion animation is in progress
+        # Loaded emotion animations by real path, least recently used first
+        self._gif_cache = OrderedDict()
+        self._gif_keys = {}  # gif_path -> os.path.realpath(gif_path)
+        self._gif_loading = set()  # Real paths being read by a _GifLoader
+        self._awaiting_gif = None  # (label, gif_path) to show once loaded
+        self._gif_loaded.connect(self._on_gif_loaded)
 
         # Volume control related
         self.volume_label = None  # Volume percentage label
@@ -196,22 +269,25 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         self.abort_callback = None
         self.send_text_callback = None
 
-        # Update queue
-        self.update_queue = queue.Queue()
+        # Pending UI updates, keyed so only the latest one per target is
+        # applied; filled from any thread, drained by a queued
+        # _process_updates() call once start() has run
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._drain_ready = False
 
         # Running flag
         self._running = True
 
         # Keyboard listener
         self.keyboard_listener = None
-        # Add set of pressed keys
-        self.pressed_keys = set()
+        # Pressed shortcut keys as a bitmask of _KEY_BITS
+        self._key_mask = 0
 
         # Swipe gesture related
         self.last_mouse_pos = None
 
         # Save timer references to avoid destruction
-        self.update_timer = None
         self.volume_update_timer = None
 
         # Animation related
@@ -241,55 +317,64 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         self.tray_icon = None
         self.tray_menu = None
         self.current_status = ""  # Current status for color change detection
+        self._tray_bucket = None  # Status bucket the tray icon was drawn for
         self.is_connected = True  # Connection status flag
+        self._app = None  # Application instance, set in set_callbacks()
+        self._last_state = None
+        # Last is_audio_channel_opened() result and its time.monotonic()
+        self._connected_memo = False
+        self._connected_checked_at = float("-inf")
 
     def eventFilter(self, source, event):
-        if source == self.volume_scale and event.type() == QEvent.MouseButtonPress:
-            if event.button() == Qt.LeftButton:
-                slider = self.volume_scale
-                opt = QStyleOptionSlider()
-                slider.initStyleOption(opt)
-
-                # Get the rectangle areas of the slider handle and groove
-                handle_rect = slider.style().subControlRect(
-                    QStyle.CC_Slider, opt, QStyle.SC_SliderHandle, slider
-                )
-                groove_rect = slider.style().subControlRect(
-                    QStyle.CC_Slider, opt, QStyle.SC_SliderGroove, slider
-                )
+        # Installed on the volume slider only; anything but a press passes
+        # straight through (QObject.eventFilter would also return False)
+        if event.type() != _MOUSE_PRESS or source is not self.volume_scale:
+            return False
+        if event.button() == _LEFT_BUTTON:
+            slider = self.volume_scale
+            opt = QStyleOptionSlider()
+            slider.initStyleOption(opt)
+
+            # Get the rectangle areas of the slider handle and groove
+            handle_rect = slider.style().subControlRect(
+                QStyle.CC_Slider, opt, QStyle.SC_SliderHandle, slider
+            )
+            groove_rect = slider.style().subControlRect(
+                QStyle.CC_Slider, opt, QStyle.SC_SliderGroove, slider
+            )
 
-                # If clicked on the handle, let the default handler process dragging
-                if handle_rect.contains(event.pos()):
-                    return False
-
-                # Calculate the click position relative to the groove
-                if slider.orientation() == Qt.Horizontal:
-                    # Ensure click is within the valid groove range
-                    if (
-                        event.pos().x() < groove_rect.left()
-                        or event.pos().x() > groove_rect.right()
-                    ):
-                        return False  # Clicked outside the groove
-                    pos = event.pos().x() - groove_rect.left()
-                    max_pos = groove_rect.width()
-                else:
-                    if (
-                        event.pos().y() < groove_rect.top()
-                        or event.pos().y() > groove_rect.bottom()
-                    ):
-                        return False  # Clicked outside the groove
-                    pos = groove_rect.bottom() - event.pos().y()
-                    max_pos = groove_rect.height()
+            # If clicked on the handle, let the default handler process dragging
+            if handle_rect.contains(event.pos()):
+                return False
 
-                if max_pos > 0:  # Avoid division by zero
-                    value_range = slider.maximum() - slider.minimum()
-                    # Calculate new value based on click position
-                    new_value = slider.minimum() + round((value_range * pos) / max_pos)
+            # Calculate the click position relative to the groove
+            if slider.orientation() == Qt.Horizontal:
+                # Ensure click is within the valid groove range
+                if (
+                    event.pos().x() < groove_rect.left()
+                    or event.pos().x() > groove_rect.right()
+                ):
+                    return False  # Clicked outside the groove
+                pos = event.pos().x() - groove_rect.left()
+                max_pos = groove_rect.width()
+            else:
+                if (
+                    event.pos().y() < groove_rect.top()
+                    or event.pos().y() > groove_rect.bottom()
+                ):
+                    return False  # Clicked outside the groove
+                pos = groove_rect.bottom() - event.pos().y()
+                max_pos = groove_rect.height()
 
-                    # Directly set the slider value
-                    slider.setValue(int(new_value))
+            if max_pos > 0:  # Avoid division by zero
+                value_range = slider.maximum() - slider.minimum()
+                # Calculate new value based on click position
+                new_value = slider.minimum() + round((value_range * pos) / max_pos)
 
-                    return True  # Indicate event has been handled
+                # Directly set the slider value
+                slider.setValue(int(new_value))
+
+                return True  # Indicate event has been handled
 
         return super().eventFilter(source, event)
 
@@ -309,12 +394,7 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
     def _on_navigation_index_changed(self, index: int):
         """Handle navigation tab change (by index)."""
         # Map back to routeKey for reusing animation and loading logic
-        index_to_routeKey = {
-            0: "mainInterface",
-            1: "iotInterface",
-            2: "settingInterface",
-        }
-        routeKey = index_to_routeKey.get(index)
+        routeKey = self._INDEX_TO_ROUTEKEY.get(index)
 
         if routeKey is None:
             self.logger.warning(f"Unknown navigation index: {index}")
@@ -361,50 +441,67 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         # This allows updating the system tray icon when device state changes
         from src.application import Application
 
-        app = Application.get_instance()
-        if app:
-            app.on_state_changed_callbacks.append(self._on_state_changed)
+        self._app = Application.get_instance()
+        if self._app:
+            self._app.on_state_changed_callbacks.append(self._on_state_changed)
 
     def _on_state_changed(self, state):
         """Listen for device state changes."""
-        # Set connection status flag
-        from src.constants.constants import DeviceState
+        if state == self._last_state:
+            return
+        self._last_state = state
 
+        # Set connection status flag
         # Check if connecting or connected
         # (CONNECTING, LISTENING, SPEAKING indicate connected)
-        if state == DeviceState.CONNECTING:
-            self.is_connected = True
-        elif state in [DeviceState.LISTENING, DeviceState.SPEAKING]:
+        if state in (
+            DeviceState.CONNECTING,
+            DeviceState.LISTENING,
+            DeviceState.SPEAKING,
+        ):
             self.is_connected = True
         elif state == DeviceState.IDLE:
-            # Get protocol instance from application to check WebSocket connection status
-            from src.application import Application
-
-            app = Application.get_instance()
-            if app and app.protocol:
-                # Check if protocol is connected
-                self.is_connected = app.protocol.is_audio_channel_opened()
-            else:
-                self.is_connected = False
+            # Reuse a recent answer if IDLE is re-entered in quick succession
+            now = time.monotonic()
+            if now - self._connected_checked_at >= 0.5:
+                self._connected_checked_at = now
+                # Get protocol instance from application to check WebSocket connection status
+                app = self._app
+                if app and app.protocol:
+                    # Check if protocol is connected
+                    self._connected_memo = app.protocol.is_audio_channel_opened()
+                else:
+                    self._connected_memo = False
+            self.is_connected = self._connected_memo
 
         # Status update handling is done in update_status method
 
+    def _post_update(self, key, func, *args):
+        """Queue func(*args) for the GUI thread, replacing any pending update
+        with the same key."""
+        with self._pending_lock:
+            schedule = not self._pending
+            self._pending[key] = (func, args)
+        # One queued drain per batch; later updates coalesce into it
+        if schedule and self._drain_ready:
+            QMetaObject.invokeMethod(self, "_process_updates", Qt.QueuedConnection)
+
+    @pyqtSlot()
     def _process_updates(self):
-        """Process update queue."""
+        """Apply the pending updates (at most one per key)."""
         if not self._running:
             return
 
-        try:
-            while True:
-                try:
-                    # Non-blocking retrieval of updates
-                    update_func = self.update_queue.get_nowait()
-                    update_func()
-                    self.update_queue.task_done()
-                except queue.Empty:
-                    break
-        except Exception as e:
-            self.logger.error(f"Error processing update queue: {e}")
+        with self._pending_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+
+        for func, args in pending.values():
+            try:
+                func(*args)
+            except Exception as e:
+                self.logger.error(f"Error processing UI update: {e}")
 
     def _on_manual_button_press(self):
         """Handle manual mode button press event."""
@@ -463,13 +560,13 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.update_mode_button_status("Auto Conversation")
 
                 # Hide manual button, show auto button
-                self.update_queue.put(self._switch_to_auto_mode)
+                self._post_update("mode", self._switch_to_auto_mode)
             else:
                 # Switch to manual mode
                 self.update_mode_button_status("Manual Conversation")
 
                 # Hide auto button, show manual button
-                self.update_queue.put(self._switch_to_manual_mode)
+                self._post_update("mode", self._switch_to_manual_mode)
 
         except Exception as e:
             self.logger.error(f"Mode toggle button callback execution failed: {e}")
@@ -488,46 +585,36 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
 
     def update_status(self, status: str):
         """Update status text (main status only)."""
-        full_status_text = f"Status: {status}"
-        self.update_queue.put(
-            lambda: self._safe_update_label(self.status_label, full_status_text)
+        if status == self.current_status:
+            return
+        self.current_status = status
+        self._post_update(
+            "status", self._set_widget_text, "status_label", f"Status: {status}"
         )
-
         # Update system tray icon
-        if status != self.current_status:
-            self.current_status = status
-            self.update_queue.put(lambda: self._update_tray_icon(status))
+        self._post_update("tray", self._update_tray_icon, status)
+
+    def update_state(self, status: str, emotion_path: Optional[str] = None):
+        """Update status text, tray icon and emotion for the next UI frame."""
+        self.update_status(status)
+        if emotion_path is not None:
+            self.update_emotion(emotion_path)
 
     def update_text(self, text: str):
         """Update TTS text."""
-        self.update_queue.put(
-            lambda: self._safe_update_label(self.tts_text_label, text)
-        )
+        self._post_update("text", self._set_widget_text, "tts_text_label", text)
 
     def update_emotion(self, emotion_path: str):
         """Update emotion animation."""
         # Avoid redundant emotion updates if path is the same
-        if (
-            hasattr(self, "_last_emotion_path")
-            and self._last_emotion_path == emotion_path
-        ):
+        if getattr(self, "_last_emotion_path", None) == emotion_path:
             return
 
         # Record the currently set path
         self._last_emotion_path = emotion_path
 
-        # Ensure UI updates are handled in the main thread
-        if QApplication.instance().thread() != QThread.currentThread():
-            # If not in main thread, use signal-slot or QMetaObject to execute in main thread
-            QMetaObject.invokeMethod(
-                self,
-                "_update_emotion_safely",
-                Qt.QueuedConnection,
-                Q_ARG(str, emotion_path),
-            )
-        else:
-            # Already in main thread, execute directly
-            self._update_emotion_safely(emotion_path)
+        # Applied on the GUI thread by _process_updates
+        self._post_update("emotion", self._update_emotion_safely, emotion_path)
 
     # Add slot function to safely update emotion in main thread
     @pyqtSlot(str)
@@ -557,7 +644,8 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             # If the same animation is already set and playing, do not reset
             if (
                 self.emotion_movie
-                and getattr(self.emotion_movie, "_gif_path", None) == gif_path
+                and getattr(self.emotion_movie, "_gif_path", None)
+                == self._gif_key(gif_path)
                 and self.emotion_movie.state() == QMovie.Running
             ):
                 return
@@ -570,40 +658,18 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             # Mark animation as in progress
             self.is_emotion_animating = True
 
+            # Read a new GIF in the background while the old one fades out
+            self._preload_gif(gif_path)
+
             # If an animation is already playing, fade it out first
             if self.emotion_movie and label.movie() == self.emotion_movie:
                 # Create opacity effect (if not already created)
-                if not self.emotion_effect:
-                    self.emotion_effect = QGraphicsOpacityEffect(label)
-                    label.setGraphicsEffect(self.emotion_effect)
-                    self.emotion_effect.setOpacity(1.0)
-
-                # Create fade-out animation
-                self.emotion_animation = QPropertyAnimation(
-                    self.emotion_effect, b"opacity"
-                )
-                self.emotion_animation.setDuration(180)  # Set animation duration (ms)
-                self.emotion_animation.setStartValue(1.0)
-                self.emotion_animation.setEndValue(0.25)
-
-                # After fade-out, set new GIF and start fade-in
-                def on_fade_out_finished():
-                    try:
-                        # Stop current GIF
-                        if self.emotion_movie:
-                            self.emotion_movie.stop()
-
-                        # Set new GIF and fade in
-                        self._set_new_emotion_gif(label, gif_path)
-                    except Exception as e:
-                        self.logger.error(f"Failed to set GIF after fade-out: {e}")
-                        self.is_emotion_animating = False
-
-                # Connect fade-out finished signal
-                self.emotion_animation.finished.connect(on_fade_out_finished)
-
-                # Start fade-out animation
-                self.emotion_animation.start()
+                self._ensure_emotion_effect(label, 1.0)
+
+                # Fade out; _on_fade_out_finished() sets the new GIF
+                self._fade_target = (label, gif_path)
+                self._fade_out.stop()
+                self._fade_out.start()
             else:
                 # If no previous animation, set new GIF and fade in
                 self._set_new_emotion_gif(label, gif_path)
@@ -620,35 +686,16 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
     def _set_new_emotion_gif(self, label, gif_path):
         """Set new GIF animation and perform fade-in effect."""
         try:
-            # Maintain GIF cache
-            if not hasattr(self, "_gif_cache"):
-                self._gif_cache = {}
-
             # Check if GIF is in cache
-            if gif_path in self._gif_cache:
-                movie = self._gif_cache[gif_path]
+            key = self._gif_key(gif_path)
+            if key in self._gif_cache:
+                movie = self._gif_cache[key]
+                self._gif_cache.move_to_end(key)
             else:
-                # Log (only on first load)
-                self.logger.info(f"Loading GIF file: {gif_path}")
-                # Create animation object
-                movie = QMovie(gif_path)
-                if not movie.isValid():
-                    self.logger.error(f"Invalid GIF file: {gif_path}")
-                    label.setText("😊")
-                    self.is_emotion_animating = False
-                    return
-
-                # Configure animation and store in cache
-                movie.setCacheMode(QMovie.CacheAll)
-                self._gif_cache[gif_path] = movie
-
-            # Save GIF path to movie object for comparison
-            movie._gif_path = gif_path
-
-            # Connect signal
-            movie.error.connect(
-                lambda: self.logger.error(f"GIF playback error: {movie.lastError()}")
-            )
+                # Still being read; _on_gif_loaded() resumes the switch
+                self._awaiting_gif = (label, gif_path)
+                self._preload_gif(gif_path)
+                return
 
             # Save new animation object
             self.emotion_movie = movie
@@ -664,36 +711,16 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             movie.setSpeed(105)
 
             # Ensure opacity is 0 (fully transparent)
-            if self.emotion_effect:
-                self.emotion_effect.setOpacity(0.0)
-            else:
-                self.emotion_effect = QGraphicsOpacityEffect(label)
-                label.setGraphicsEffect(self.emotion_effect)
-                self.emotion_effect.setOpacity(0.0)
+            self._ensure_emotion_effect(label, 0.0)
+            self.emotion_effect.setOpacity(0.0)
 
             # Start playing animation
             movie.start()
 
-            # Create fade-in animation
-            self.emotion_animation = QPropertyAnimation(self.emotion_effect, b"opacity")
-            self.emotion_animation.setDuration(180)  # Fade-in duration (ms)
-            self.emotion_animation.setStartValue(0.25)
-            self.emotion_animation.setEndValue(1.0)
-
-            # Check for next emotion to display after fade-in
-            def on_fade_in_finished():
-                self.is_emotion_animating = False
-                # If there is a next emotion to display, switch to it
-                if self.next_emotion_path:
-                    next_path = self.next_emotion_path
-                    self.next_emotion_path = None
-                    self._set_emotion_gif(label, next_path)
-
-            # Connect fade-in finished signal
-            self.emotion_animation.finished.connect(on_fade_in_finished)
-
-            # Start fade-in animation
-            self.emotion_animation.start()
+            # Fade in; _on_fade_in_finished() moves on to any queued emotion
+            self._fade_target = (label, gif_path)
+            self._fade_in.stop()
+            self._fade_in.start()
 
         except Exception as e:
             self.logger.error(f"Failed to set new GIF animation: {e}")
@@ -704,46 +731,156 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             except Exception:
                 pass
 
-    def _safe_update_label(self, label, text):
-        """Safely update label text."""
-        if label and not self.root.isHidden():
-            try:
-                label.setText(text)
-            except RuntimeError as e:
-                self.logger.error(f"Failed to update label: {e}")
+    def _ensure_emotion_effect(self, label, opacity):
+        """Create the opacity effect and its fade animations on first use."""
+        if self.emotion_effect:
+            return
+        self.emotion_effect = QGraphicsOpacityEffect(label)
+        label.setGraphicsEffect(self.emotion_effect)
+        self.emotion_effect.setOpacity(opacity)
+
+        self._fade_out = QPropertyAnimation(self.emotion_effect, b"opacity")
+        self._fade_out.setDuration(180)  # Fade-out duration (ms)
+        self._fade_out.setStartValue(1.0)
+        self._fade_out.setEndValue(0.25)
+        self._fade_out.finished.connect(self._on_fade_out_finished)
+
+        self._fade_in = QPropertyAnimation(self.emotion_effect, b"opacity")
+        self._fade_in.setDuration(180)  # Fade-in duration (ms)
+        self._fade_in.setStartValue(0.25)
+        self._fade_in.setEndValue(1.0)
+        self._fade_in.finished.connect(self._on_fade_in_finished)
+
+    def _on_fade_out_finished(self):
+        """After fade-out, set new GIF and start fade-in."""
+        label, gif_path = self._fade_target
+        try:
+            # Stop current GIF
+            if self.emotion_movie:
+                self.emotion_movie.stop()
+
+            # Set new GIF and fade in
+            self._set_new_emotion_gif(label, gif_path)
+        except Exception as e:
+            self.logger.error(f"Failed to set GIF after fade-out: {e}")
+            self.is_emotion_animating = False
 
-    def start_update_threads(self):
-        """Start update thread."""
-        # Initialize emotion cache
-        self.last_emotion_path = None
+    def _on_fade_in_finished(self):
+        """Check for next emotion to display after fade-in."""
+        label, _ = self._fade_target
+        self.is_emotion_animating = False
+        # If there is a next emotion to display, switch to it
+        if self.next_emotion_path:
+            next_path = self.next_emotion_path
+            self.next_emotion_path = None
+            self._set_emotion_gif(label, next_path)
+
+    def _gif_key(self, gif_path):
+        """Cache key for a GIF, so different spellings of a path share one
+        QMovie."""
+        key = self._gif_keys.get(gif_path)
+        if key is None:
+            key = self._gif_keys[gif_path] = os.path.realpath(gif_path)
+        return key
+
+    def _preload_gif(self, gif_path):
+        """Start reading a GIF on the global thread pool unless it is
+        cached or already being read."""
+        key = self._gif_key(gif_path)
+        if key in self._gif_cache or key in self._gif_loading:
+            return
+        # Log (only on first load)
+        self.logger.info(f"Loading GIF file: {gif_path}")
+        self._gif_loading.add(key)
+        QThreadPool.globalInstance().start(_GifLoader(key, self._gif_loaded))
+
+    @pyqtSlot(str, object)
+    def _on_gif_loaded(self, key, data):
+        """Create the QMovie for a GIF read by _GifLoader and cache it."""
+        self._gif_loading.discard(key)
+
+        movie = None
+        if data:
+            # Create animation object from the file contents
+            buffer = QBuffer()
+            buffer.setData(data)
+            buffer.open(QIODevice.ReadOnly)
+            movie = QMovie(buffer)
+            buffer.setParent(movie)
+            if not movie.isValid():
+                movie.deleteLater()
+                movie = None
+
+        if movie is None:
+            self.logger.error(f"Invalid GIF file: {key}")
+        else:
+            # Configure animation and store in cache
+            movie.setCacheMode(QMovie.CacheAll)
+            # Save GIF path to movie object for comparison
+            movie._gif_path = key
+            # Connect signal (once, not on every reuse from the cache)
+            movie.error.connect(
+                lambda: self.logger.error(f"GIF playback error: {movie.lastError()}")
+            )
+            self._gif_cache[key] = movie
+            self._evict_gif_cache()
 
-        def update_loop():
-            while self._running:
-                try:
-                    # Update status
-                    if self.status_update_callback:
-                        status = self.status_update_callback()
-                        if status:
-                            self.update_status(status)
-
-                    # Update text
-                    if self.text_update_callback:
-                        text = self.text_update_callback()
-                        if text:
-                            self.update_text(text)
-
-                    # Update emotion - only when emotion changes
-                    if self.emotion_update_callback:
-                        emotion = self.emotion_update_callback()
-                        if emotion:
-                            # Directly call update_emotion, which handles duplicate checks
-                            self.update_emotion(emotion)
+        if self._awaiting_gif is None:
+            return
+        label, gif_path = self._awaiting_gif
+        if self._gif_key(gif_path) != key:
+            return
+        self._awaiting_gif = None
+        if movie is None:
+            label.setText("😊")
+            self.is_emotion_animating = False
+        else:
+            self._set_new_emotion_gif(label, gif_path)
 
-                except Exception as e:
-                    self.logger.error(f"Update failed: {e}")
-                time.sleep(0.1)
+    def _evict_gif_cache(self):
+        """Drop the least recently used animations beyond GIF_CACHE_SIZE."""
+        while len(self._gif_cache) > self.GIF_CACHE_SIZE:
+            _, movie = self._gif_cache.popitem(last=False)
+            # Movies on screen are the most recently used, never the oldest
+            movie.stop()
+            movie.deleteLater()
 
-        threading.Thread(target=update_loop, daemon=True).start()
+    def _set_widget_text(self, attr, text):
+        """Set the text of the widget held in attribute attr.
+
+        Looked up when applied, so updates posted before the UI is built
+        still reach the widget.
+        """
+        widget = getattr(self, attr)
+        if widget and not self.root.isHidden():
+            try:
+                widget.setText(text)
+            except RuntimeError as e:
+                self.logger.error(f"Failed to update {attr}: {e}")
+
+    def _sync_initial_state(self):
+        """Show the application's current status, text and emotion once.
+
+        After this the application pushes changes through update_state(),
+        update_text() and update_emotion(), so nothing needs to poll.
+        """
+        try:
+            if self.status_update_callback:
+                status = self.status_update_callback()
+                if status:
+                    self.update_status(status)
+
+            if self.text_update_callback:
+                text = self.text_update_callback()
+                if text:
+                    self.update_text(text)
+
+            if self.emotion_update_callback:
+                emotion = self.emotion_update_callback()
+                if emotion:
+                    self.update_emotion(emotion)
+        except Exception as e:
+            self.logger.error(f"Initial display update failed: {e}")
 
     def on_close(self):
         """Handle window close."""
@@ -752,18 +889,12 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         # Ensure timers are stopped in main thread
         if QThread.currentThread() != QApplication.instance().thread():
             # If in non-main thread, use QMetaObject.invokeMethod to execute in main thread
-            if self.update_timer:
-                QMetaObject.invokeMethod(self.update_timer, "stop", Qt.QueuedConnection)
-
             if self.ha_update_timer:
                 QMetaObject.invokeMethod(
                     self.ha_update_timer, "stop", Qt.QueuedConnection
                 )
         else:
             # Already in main thread, stop directly
-            if self.update_timer:
-                self.update_timer.stop()
-
             if self.ha_update_timer:
                 self.ha_update_timer.stop()
 
@@ -774,7 +905,7 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         self.stop_keyboard_listener()
 
     def start(self):
-        """Start GUI."""
+        """Start GUI and return the QApplication instance."""
         try:
             # Ensure QApplication instance is created in main thread
             self.app = QApplication.instance()
@@ -796,19 +927,32 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
 
             uic.loadUi(str(ui_path), self.root)
 
+            # Index named children in one tree walk instead of a findChild()
+            # walk per widget; the first object with a name wins, as with
+            # findChild()
+            named = {}
+            for obj in self.root.findChildren(QObject):
+                name = obj.objectName()
+                if name:
+                    named.setdefault(name, obj)
+
+            def find(cls, name):
+                obj = named.get(name)
+                return obj if isinstance(obj, cls) else None
+
             # Get UI widgets
-            self.status_label = self.root.findChild(QLabel, "status_label")
-            self.emotion_label = self.root.findChild(QLabel, "emotion_label")
-            self.tts_text_label = self.root.findChild(QLabel, "tts_text_label")
-            self.manual_btn = self.root.findChild(QPushButton, "manual_btn")
-            self.abort_btn = self.root.findChild(QPushButton, "abort_btn")
-            self.auto_btn = self.root.findChild(QPushButton, "auto_btn")
-            self.mode_btn = self.root.findChild(QPushButton, "mode_btn")
+            self.status_label = find(QLabel, "status_label")
+            self.emotion_label = find(QLabel, "emotion_label")
+            self.tts_text_label = find(QLabel, "tts_text_label")
+            self.manual_btn = find(QPushButton, "manual_btn")
+            self.abort_btn = find(QPushButton, "abort_btn")
+            self.auto_btn = find(QPushButton, "auto_btn")
+            self.mode_btn = find(QPushButton, "mode_btn")
 
             # Add shortcut hint label
             try:
                 # Find main page layout
-                main_page = self.root.findChild(QWidget, "mainPage")
+                main_page = find(QWidget, "mainPage")
                 if main_page:
                     main_layout = main_page.layout()
                     if main_layout:
@@ -836,17 +980,13 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.logger.warning(f"Failed to add shortcut hint label: {e}")
 
             # Get IOT page widget
-            self.iot_card = self.root.findChild(
-                QFrame, "iotPage"
-            )  # Note: Use "iotPage" as ID
+            self.iot_card = find(QFrame, "iotPage")  # Note: Use "iotPage" as ID
             if self.iot_card is None:
                 # If iotPage not found, try other possible names
-                self.iot_card = self.root.findChild(QFrame, "iot_card")
+                self.iot_card = find(QFrame, "iot_card")
                 if self.iot_card is None:
                     # If still not found, try getting second page from stackedWidget as iot_card
-                    self.stackedWidget = self.root.findChild(
-                        QStackedWidget, "stackedWidget"
-                    )
+                    self.stackedWidget = find(QStackedWidget, "stackedWidget")
                     if self.stackedWidget and self.stackedWidget.count() > 1:
                         self.iot_card = self.stackedWidget.widget(
                             1
@@ -860,21 +1000,21 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.logger.info(f"Found iot_card: {self.iot_card}")
 
             # Volume control page
-            self.volume_page = self.root.findChild(QWidget, "volume_page")
+            self.volume_page = find(QWidget, "volume_page")
 
             # Volume control widgets
-            self.volume_scale = self.root.findChild(QSlider, "volume_scale")
-            self.mute = self.root.findChild(QPushButton, "mute")
+            self.volume_scale = find(QSlider, "volume_scale")
+            self.mute = find(QPushButton, "mute")
 
             if self.mute:
                 self.mute.setCheckable(True)
                 self.mute.clicked.connect(self._on_mute_click)
 
             # Get or create volume percentage label
-            self.volume_label = self.root.findChild(QLabel, "volume_label")
+            self.volume_label = find(QLabel, "volume_label")
             if not self.volume_label and self.volume_scale:
                 # If no volume label in UI, dynamically create one
-                volume_layout = self.root.findChild(QHBoxLayout, "volume_layout")
+                volume_layout = find(QHBoxLayout, "volume_layout")
                 if volume_layout:
                     self.volume_label = QLabel(f"{self.current_volume}%")
                     self.volume_label.setObjectName("volume_label")
@@ -907,37 +1047,25 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                     self.volume_label.setText(f"{self.current_volume}%")
 
             # Get settings page widgets
-            self.wakeWordEnableSwitch = self.root.findChild(
-                QCheckBox, "wakeWordEnableSwitch"
-            )
-            self.wakeWordsLineEdit = self.root.findChild(QLineEdit, "wakeWordsLineEdit")
-            self.saveSettingsButton = self.root.findChild(
-                QPushButton, "saveSettingsButton"
-            )
+            self.wakeWordEnableSwitch = find(QCheckBox, "wakeWordEnableSwitch")
+            self.wakeWordsLineEdit = find(QLineEdit, "wakeWordsLineEdit")
+            self.saveSettingsButton = find(QPushButton, "saveSettingsButton")
             # Get new widgets
             # Replace with standard PyQt widgets
-            self.deviceIdLineEdit = self.root.findChild(QLineEdit, "deviceIdLineEdit")
-            self.wsProtocolComboBox = self.root.findChild(
-                QComboBox, "wsProtocolComboBox"
-            )
-            self.wsAddressLineEdit = self.root.findChild(QLineEdit, "wsAddressLineEdit")
-            self.wsTokenLineEdit = self.root.findChild(QLineEdit, "wsTokenLineEdit")
+            self.deviceIdLineEdit = find(QLineEdit, "deviceIdLineEdit")
+            self.wsProtocolComboBox = find(QComboBox, "wsProtocolComboBox")
+            self.wsAddressLineEdit = find(QLineEdit, "wsAddressLineEdit")
+            self.wsTokenLineEdit = find(QLineEdit, "wsTokenLineEdit")
             # Home Assistant widget references
-            self.haProtocolComboBox = self.root.findChild(
-                QComboBox, "haProtocolComboBox"
-            )
-            self.ha_server = self.root.findChild(QLineEdit, "ha_server")
-            self.ha_port = self.root.findChild(QLineEdit, "ha_port")
-            self.ha_key = self.root.findChild(QLineEdit, "ha_key")
-            self.Add_ha_devices = self.root.findChild(QPushButton, "Add_ha_devices")
+            self.haProtocolComboBox = find(QComboBox, "haProtocolComboBox")
+            self.ha_server = find(QLineEdit, "ha_server")
+            self.ha_port = find(QLineEdit, "ha_port")
+            self.ha_key = find(QLineEdit, "ha_key")
+            self.Add_ha_devices = find(QPushButton, "Add_ha_devices")
 
             # Get OTA-related widgets
-            self.otaProtocolComboBox = self.root.findChild(
-                QComboBox, "otaProtocolComboBox"
-            )
-            self.otaAddressLineEdit = self.root.findChild(
-                QLineEdit, "otaAddressLineEdit"
-            )
+            self.otaProtocolComboBox = find(QComboBox, "otaProtocolComboBox")
+            self.otaAddressLineEdit = find(QLineEdit, "otaAddressLineEdit")
 
             # Explicitly add ComboBox options to prevent UI file loading issues
             if self.wsProtocolComboBox:
@@ -956,8 +1084,8 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.haProtocolComboBox.addItems(["http://", "https://"])
 
             # Get navigation widgets
-            self.stackedWidget = self.root.findChild(QStackedWidget, "stackedWidget")
-            self.nav_tab_bar = self.root.findChild(QTabBar, "nav_tab_bar")
+            self.stackedWidget = find(QStackedWidget, "stackedWidget")
+            self.nav_tab_bar = find(QTabBar, "nav_tab_bar")
 
             # Initialize navigation tab bar
             self._setup_navigation()
@@ -976,8 +1104,8 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.mode_btn.clicked.connect(self._on_mode_button_click)
 
             # Initialize text input and send button
-            self.text_input = self.root.findChild(QLineEdit, "text_input")
-            self.send_btn = self.root.findChild(QPushButton, "send_btn")
+            self.text_input = find(QLineEdit, "text_input")
+            self.send_btn = find(QPushButton, "send_btn")
             if self.text_input and self.send_btn:
                 self.send_btn.clicked.connect(self._on_send_button_click)
                 # Bind Enter key to send text
@@ -1004,19 +1132,21 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             # Start keyboard listener
             self.start_keyboard_listener()
 
-            # Start update thread
-            self.start_update_threads()
+            # Show the current state; later changes are pushed by the application
+            self._sync_initial_state()
 
-            # Timer to process update queue
-            self.update_timer = QTimer()
-            self.update_timer.timeout.connect(self._process_updates)
-            self.update_timer.start(100)
+            # From now on each batch of UI updates is applied by a queued
+            # call; apply whatever was posted before the UI existed
+            self._drain_ready = True
+            QMetaObject.invokeMethod(self, "_process_updates", Qt.QueuedConnection)
 
             # Run main loop in main thread
             self.logger.info("Starting GUI main loop")
             self.root.show()
             # self.root.showFullScreen() # Full-screen display
 
+            return self.app
+
         except Exception as e:
             self.logger.error(f"GUI startup failed: {e}", exc_info=True)
             # Fallback to CLI mode
@@ -1077,21 +1207,25 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             return
 
         try:
-            icon_color = self._get_status_color(status)
-
-            # Create icon with specified color
-            pixmap = QPixmap(16, 16)
-            pixmap.fill(Qt.transparent)
-
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setBrush(QBrush(icon_color))
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(2, 2, 12, 12)
-            painter.end()
-
-            # Set icon
-            self.tray_icon.setIcon(QIcon(pixmap))
+            # Only repaint when the color would change
+            bucket = self._status_bucket(status)
+            if bucket != self._tray_bucket:
+                self._tray_bucket = bucket
+                icon_color = self._STATUS_COLORS[bucket]
+
+                # Create icon with specified color
+                pixmap = QPixmap(16, 16)
+                pixmap.fill(Qt.transparent)
+
+                painter = QPainter(pixmap)
+                painter.setRenderHint(QPainter.Antialiasing)
+                painter.setBrush(QBrush(icon_color))
+                painter.setPen(Qt.NoPen)
+                painter.drawEllipse(2, 2, 12, 12)
+                painter.end()
+
+                # Set icon
+                self.tray_icon.setIcon(QIcon(pixmap))
 
             # Set tooltip text
             tooltip = f"XiaoZhi AI Assistant - {status}"
@@ -1100,22 +1234,31 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         except Exception as e:
             self.logger.error(f"Failed to update system tray icon: {e}")
 
-    def _get_status_color(self, status):
-        """Return color corresponding to status."""
+    # Tray icon color per status bucket
+    _STATUS_COLORS = {
+        "disconnected": QColor(128, 128, 128),  # Gray
+        "error": QColor(255, 0, 0),  # Red
+        "listening": QColor(255, 200, 0),  # Yellow
+        "speaking": QColor(0, 120, 255),  # Blue
+        "idle": QColor(0, 180, 0),  # Green - Idle/Started state
+    }
+
+    def _status_bucket(self, status):
+        """Collapse a status text to the tray icon state it shows."""
         if not self.is_connected:
-            return QColor(128, 128, 128)  # Gray - Disconnected
+            return "disconnected"
 
         if "Error" in status:
-            return QColor(255, 0, 0)  # Red - Error state
+            return "error"
 
         elif "Listening" in status:
-            return QColor(255, 200, 0)  # Yellow - Listening state
+            return "listening"
 
         elif "Speaking" in status:
-            return QColor(0, 120, 255)  # Blue - Speaking state
+            return "speaking"
 
         else:
-            return QColor(0, 180, 0)  # Green - Idle/Started state
+            return "idle"
 
     def _tray_icon_activated(self, reason):
         """Handle tray icon click event."""
@@ -1129,6 +1272,11 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.root.showNormal()
             if not self.root.isVisible():
                 self.root.show()
+                # Updates are pushed once and skipped while the window is
+                # hidden, so show the current state again
+                self.current_status = ""
+                self._last_emotion_path = None
+                self._sync_initial_state()
             self.root.activateWindow()
             self.root.raise_()
 
@@ -1136,9 +1284,6 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         """Quit application."""
         self._running = False
         # Stop all threads and timers
-        if self.update_timer:
-            self.update_timer.stop()
-
         if self.ha_update_timer:
             self.ha_update_timer.stop()
 
@@ -1171,25 +1316,17 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
 
     def update_mode_button_status(self, text: str):
         """Update mode button status."""
-        self.update_queue.put(lambda: self._safe_update_button(self.mode_btn, text))
+        self._post_update("mode_btn", self._set_widget_text, "mode_btn", text)
 
     def update_button_status(self, text: str):
         """Update button status - retained to meet abstract base class requirements."""
         # Update the appropriate button based on current mode
         if self.auto_mode:
-            self.update_queue.put(lambda: self._safe_update_button(self.auto_btn, text))
+            self._post_update("auto_btn", self._set_widget_text, "auto_btn", text)
         else:
             # In manual mode, button text is controlled directly by press/release events
             pass
 
-    def _safe_update_button(self, button, text):
-        """Safely update button text."""
-        if button and not self.root.isHidden():
-            try:
-                button.setText(text)
-            except RuntimeError as e:
-                self.logger.error(f"Failed to update button: {e}")
-
     def _on_volume_change(self, value):
         """Handle volume slider change with throttling."""
 
@@ -1229,9 +1366,9 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             except RuntimeError as e:
                 self.logger.error(f"Failed to update volume UI: {e}")
 
-    def is_combo(self, *keys):
-        """Check if a combination of keys is pressed."""
-        return all(k in self.pressed_keys for k in keys)
+    def is_combo(self, combo):
+        """Check if a combination of keys (a _KEY_BITS mask) is pressed."""
+        return self._key_mask & combo == combo
 
     def start_keyboard_listener(self):
         """Start keyboard listener."""
@@ -1243,46 +1380,53 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             return
 
         try:
+            modifier_bits = {
+                pynput_keyboard.Key.alt_l: _KEY_BITS["alt"],
+                pynput_keyboard.Key.alt_r: _KEY_BITS["alt"],
+                pynput_keyboard.Key.shift_l: _KEY_BITS["shift"],
+                pynput_keyboard.Key.shift_r: _KEY_BITS["shift"],
+            }
+
+            def key_bit(key):
+                bit = modifier_bits.get(key)
+                if bit is None:
+                    char = getattr(key, "char", None)
+                    bit = _KEY_BITS.get(char.lower(), 0) if char else 0
+                return bit
 
             def on_press(key):
                 try:
-                    # Record pressed keys
-                    if (
-                        key == pynput_keyboard.Key.alt_l
-                        or key == pynput_keyboard.Key.alt_r
-                    ):
-                        self.pressed_keys.add("alt")
-                    elif (
-                        key == pynput_keyboard.Key.shift_l
-                        or key == pynput_keyboard.Key.shift_r
-                    ):
-                        self.pressed_keys.add("shift")
-                    elif hasattr(key, "char") and key.char:
-                        self.pressed_keys.add(key.char.lower())
+                    # Record pressed keys; other keys and auto-repeat of a
+                    # held key change nothing, so return right away
+                    mask = self._key_mask | key_bit(key)
+                    if mask == self._key_mask:
+                        return
+                    self._key_mask = mask
 
                     # Long-press to speak - handle in manual mode
-                    if not self.auto_mode and self.is_combo("alt", "shift", "v"):
+                    if not self.auto_mode and self.is_combo(_COMBO_TALK):
                         if self.button_press_callback:
                             self.button_press_callback()
                             if self.manual_btn:
-                                self.update_queue.put(
-                                    lambda: self._safe_update_button(
-                                        self.manual_btn, "Release to Stop"
-                                    )
+                                self._post_update(
+                                    "manual_btn",
+                                    self._set_widget_text,
+                                    "manual_btn",
+                                    "Release to Stop",
                                 )
 
                     # Auto conversation mode
-                    if self.is_combo("alt", "shift", "a"):
+                    if self.is_combo(_COMBO_AUTO):
                         if self.auto_callback:
                             self.auto_callback()
 
                     # Interrupt
-                    if self.is_combo("alt", "shift", "x"):
+                    if self.is_combo(_COMBO_ABORT):
                         if self.abort_callback:
                             self.abort_callback()
 
                     # Mode toggle
-                    if self.is_combo("alt", "shift", "m"):
+                    if self.is_combo(_COMBO_MODE):
                         self._on_mode_button_click()
 
                 except Exception as e:
@@ -1291,28 +1435,22 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             def on_release(key):
                 try:
                     # Clear released keys
-                    if (
-                        key == pynput_keyboard.Key.alt_l
-                        or key == pynput_keyboard.Key.alt_r
-                    ):
-                        self.pressed_keys.discard("alt")
-                    elif (
-                        key == pynput_keyboard.Key.shift_l
-                        or key == pynput_keyboard.Key.shift_r
-                    ):
-                        self.pressed_keys.discard("shift")
-                    elif hasattr(key, "char") and key.char:
-                        self.pressed_keys.discard(key.char.lower())
+                    was_talking = self.is_combo(_COMBO_TALK)
+                    mask = self._key_mask & ~key_bit(key)
+                    if mask == self._key_mask:
+                        return
+                    self._key_mask = mask
 
                     # Release keys, stop voice input (only in manual mode)
-                    if not self.auto_mode and not self.is_combo("alt", "shift", "v"):
+                    if not self.auto_mode and was_talking:
                         if self.button_release_callback:
                             self.button_release_callback()
                             if self.manual_btn:
-                                self.update_queue.put(
-                                    lambda: self._safe_update_button(
-                                        self.manual_btn, "Press and Hold to Speak"
-                                    )
+                                self._post_update(
+                                    "manual_btn",
+                                    self._set_widget_text,
+                                    "manual_btn",
+                                    "Press and Hold to Speak",
                                 )
                 except Exception as e:
                     self.logger.error(f"Keyboard event handling error: {e}")
@@ -2072,8 +2210,12 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
     def _update_device_ui(self, entity_id, state, label):
         """Update device UI display."""
         # Perform UI update in the main thread
-        self.update_queue.put(
-            lambda: self._safe_update_device_label(entity_id, state, label)
+        self._post_update(
+            ("device", entity_id),
+            self._safe_update_device_label,
+            entity_id,
+            state,
+            label,
         )
 
     def _safe_update_device_label(self, entity_id, state, label):
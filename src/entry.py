@@ -0,0 +1,160 @@
+import signal
+import sys
+
+# Exit cleanly if Ctrl+C arrives while the application is still importing;
+# main() re-arms SIGINT with the shutdown handler once the app is created
+signal.signal(signal.SIGINT, lambda sig, frame: sys.exit(130))
+
+import os  # noqa: E402
+from types import SimpleNamespace  # noqa: E402
+
+# Module logger, created on first use by _log() so that --help and argument
+# errors never build the logging tree
+_logger = None
+
+
+def _log():
+    """Return the module logger, creating it on first use."""
+    global _logger
+    if _logger is None:
+        from src.utils.logging_config import get_logger
+
+        _logger = get_logger(__name__)
+    return _logger
+
+
+# Allowed values for the --mode and --protocol options
+_MODES = frozenset(("gui", "cli"))
+_PROTOCOLS = frozenset(("mqtt", "websocket"))
+_CHOICES = {"mode": _MODES, "protocol": _PROTOCOLS}
+
+USAGE = """usage: main.py [-h] [--mode {gui,cli}] [--protocol {mqtt,websocket}] [--debug]
+
+XiaoZhi AI Client
+
+options:
+  -h, --help            show this help message and exit
+  --mode {gui,cli}      Run mode: gui (graphical interface) or cli (command line)
+  --protocol {mqtt,websocket}
+                        Communication protocol: mqtt or websocket
+  --debug               Log full tracebacks for fatal errors
+"""
+
+
+def _arg_error(message):
+    """Print an argument error with usage and exit with status 2."""
+    sys.stderr.write(USAGE.split("\n", 1)[0] + "\n")
+    sys.stderr.write(f"main.py: error: {message}\n")
+    sys.exit(2)
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    args = SimpleNamespace(mode="gui", protocol="websocket", debug=False)
+
+    tokens = list(sys.argv[1:] if argv is None else argv)
+    while tokens:
+        token = tokens.pop(0)
+        if token in ("-h", "--help"):
+            sys.stdout.write(USAGE)
+            sys.exit(0)
+        if token == "--debug":
+            args.debug = True
+            continue
+
+        name, sep, value = token.partition("=")
+        option = name[2:] if name.startswith("--") else None
+        if option not in _CHOICES:
+            _arg_error(f"unrecognized arguments: {token}")
+        if not sep:
+            if not tokens:
+                _arg_error(f"argument {name}: expected one argument")
+            value = tokens.pop(0)
+        if value not in _CHOICES[option]:
+            allowed = ", ".join(repr(c) for c in sorted(_CHOICES[option]))
+            _arg_error(
+                f"argument {name}: invalid choice: {value!r} (choose from {allowed})"
+            )
+        setattr(args, option, value)
+
+    return args
+
+
+def make_signal_handler(app):
+    """Build the Ctrl+C handler bound to the given Application instance."""
+    shutting_down = False
+
+    def handler(sig, frame):
+        nonlocal shutting_down
+        # A second Ctrl+C during a slow shutdown exits immediately
+        if shutting_down:
+            os._exit(130)
+        shutting_down = True
+
+        _log().info("Received interrupt signal, shutting down...")
+        try:
+            app.shutdown()
+        finally:
+            # Everything that needs a graceful close is released by
+            # app.shutdown(); skip interpreter finalization (atexit, __del__,
+            # Qt teardown)
+            import logging
+
+            logging.shutdown()
+            os._exit(0)
+
+    return handler
+
+
+def main():
+    """Program entry point."""
+    # Ensure sys.stdout and sys.stderr are not None (pythonw / --noconsole builds)
+    if sys.stdout is None or sys.stderr is None:
+        import io
+
+        if sys.stdout is None:
+            sys.stdout = io.StringIO()
+        if sys.stderr is None:
+            sys.stderr = io.StringIO()
+
+    # Parse command-line arguments
+    args = parse_args()
+    try:
+        # Logging (configured only once arguments are known to be valid)
+        from src.utils.logging_config import setup_logging
+
+        setup_logging(mode=args.mode, interactive=sys.stdout.isatty())
+        # Import application only after arguments have been validated
+        from src.application import Application
+
+        # Create application and replace the startup SIGINT handler with one
+        # bound to this instance
+        app = Application.get_instance()
+        signal.signal(signal.SIGINT, make_signal_handler(app))
+
+        _log().info("Application started, press Ctrl+C to exit")
+
+        # Start application with parameters; GUI mode returns the QApplication
+        qt_app = app.run(mode=args.mode, protocol=args.protocol)
+
+        # If in GUI mode and using PyQt interface, start Qt event loop; skip it
+        # when no top-level window is left (e.g. closed during startup)
+        if args.mode == "gui" and qt_app is not None and qt_app.topLevelWidgets():
+            try:
+                _log().info("Starting Qt event loop")
+                qt_app.exec_()
+                _log().info("Qt event loop ended")
+            except Exception as e:
+                _log().error("Qt event loop error: %s", e, exc_info=True)
+
+    except Exception as e:
+        if args.debug:
+            _log().error("Program error: %s", e, exc_info=True)
+        else:
+            import traceback
+
+            msg = "".join(traceback.format_exception_only(type(e), e))
+            _log().error("Program error: %s", msg.strip())
+        return 1
+
+    return 0
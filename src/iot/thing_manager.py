@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.iot.thing import Thing
 
@@ -16,43 +16,42 @@ class ThingManager:
 
     def __init__(self):
         self.things = []
+        self._things_by_name = {}  # 设备名 -> 设备, 同名时保留先添加的
         self.last_states = {}  # 添加状态缓存字典，存储上一次的状态
 
     def add_thing(self, thing: Thing) -> None:
         self.things.append(thing)
+        self._things_by_name.setdefault(thing.name, thing)
 
     def get_descriptors_json(self) -> str:
         descriptors = [thing.get_descriptor_json() for thing in self.things]
         return json.dumps(descriptors)
 
-    def get_states_json(self, delta=False) -> Tuple[bool, str]:
-        """获取所有设备的状态JSON.
+    def get_states(self, delta=False) -> Tuple[bool, List[Dict]]:
+        """获取所有设备的状态列表 (不做JSON序列化).
 
         Args:
             delta: 是否只返回变化的部分，True表示只返回变化的部分
 
         Returns:
-            Tuple[str, bool]: 返回JSON字符串和是否有状态变化的布尔值
+            Tuple[bool, List[Dict]]: 是否有状态变化的布尔值和状态列表
         """
         if not delta:
             self.last_states.clear()
 
         changed = False
         states = []
+        last_states = self.last_states
 
         for thing in self.things:
             state_json = thing.get_state_json()
 
             if delta:
                 # 检查状态是否变化
-                is_same = (
-                    thing.name in self.last_states
-                    and self.last_states[thing.name] == state_json
-                )
-                if is_same:
+                if last_states.get(thing.name) == state_json:
                     continue
                 changed = True
-                self.last_states[thing.name] = state_json
+                last_states[thing.name] = state_json
 
             # 检查state_json是否已经是字典对象
             if isinstance(state_json, dict):
@@ -60,6 +59,18 @@ class ThingManager:
             else:
                 states.append(json.loads(state_json))  # 转换JSON字符串为字典
 
+        return changed, states
+
+    def get_states_json(self, delta=False) -> Tuple[bool, str]:
+        """获取所有设备的状态JSON.
+
+        Args:
+            delta: 是否只返回变化的部分，True表示只返回变化的部分
+
+        Returns:
+            Tuple[bool, str]: 是否有状态变化的布尔值和JSON字符串
+        """
+        changed, states = self.get_states(delta=delta)
         return changed, json.dumps(states)
 
     def get_states_json_str(self) -> str:
@@ -77,10 +88,41 @@ class ThingManager:
             Optional[Any]: 如果找到设备并调用成功，返回调用结果；否则抛出异常
         """
         thing_name = command.get("name")
-        for thing in self.things:
-            if thing.name == thing_name:
-                return thing.invoke(command)
+        thing = self._things_by_name.get(thing_name)
+        if thing is not None:
+            return thing.invoke(command)
 
         # 记录错误日志
         logging.error(f"设备不存在: {thing_name}")
         raise ValueError(f"设备不存在: {thing_name}")
+
+    def invoke_batch(
+        self, commands: List[Dict]
+    ) -> List[Tuple[Dict, Optional[Any], Optional[Exception]]]:
+        """批量调用设备方法.
+
+        每个设备名只查找一次, 命令按原顺序执行; 单条命令失败不影响其余命令.
+
+        Args:
+            commands: 命令字典列表
+
+        Returns:
+            List[Tuple[Dict, Optional[Any], Optional[Exception]]]:
+                每条命令的 (命令, 结果, 异常), 成功时异常为None
+        """
+        things_by_name = self._things_by_name
+        resolved = {
+            name: things_by_name.get(name)
+            for name in {command.get("name") for command in commands}
+        }
+
+        results = []
+        for command in commands:
+            thing = resolved[command.get("name")]
+            try:
+                if thing is None:
+                    raise ValueError(f"设备不存在: {command.get('name')}")
+                results.append((command, thing.invoke(command), None))
+            except Exception as e:
+                results.append((command, None, e))
+        return results
@@ -1,6 +1,7 @@
 import os
 import threading
 import time
+from functools import partial
 from typing import Any, Dict, Tuple
 
 import pygame
@@ -506,7 +507,7 @@ class MusicPlayer(Thing):
             # 使用schedule方法安全地更新UI
             if self.app:
                 self.app.schedule(
-                    lambda: self.app.set_chat_message("assistant", display_text)
+                    partial(self.app.set_chat_message, "assistant", display_text)
                 )
             logger.debug(f"显示歌词: {lyric_text}")
 
@@ -992,8 +993,10 @@ class MusicPlayer(Thing):
             # 更新UI显示
             if self.app:
                 self.app.schedule(
-                    lambda: self.app.set_chat_message(
-                        "assistant", f"正在播放: {self.current_song}"
+                    partial(
+                        self.app.set_chat_message,
+                        "assistant",
+                        f"正在播放: {self.current_song}",
                     )
                 )
 
@@ -1033,8 +1036,10 @@ class MusicPlayer(Thing):
 
             if self.app:
                 self.app.schedule(
-                    lambda: self.app.set_chat_message(
-                        "assistant", f"继续播放: {self.current_song}"
+                    partial(
+                        self.app.set_chat_message,
+                        "assistant",
+                        f"继续播放: {self.current_song}",
                     )
                 )
 
@@ -1052,7 +1057,8 @@ class MusicPlayer(Thing):
                 pos_str = self._format_time(self.current_position)
                 dur_str = self._format_time(self.total_duration)
                 self.app.schedule(
-                    lambda: self.app.set_chat_message(
+                    partial(
+                        self.app.set_chat_message,
                         "assistant",
                         f"已暂停: {self.current_song} [{pos_str}/{dur_str}]",
                     )
@@ -1112,7 +1118,7 @@ class MusicPlayer(Thing):
         # 返回结果
         msg = f"已停止播放: {current_song}"
         if self.app:
-            self.app.schedule(lambda: self.app.set_chat_message("assistant", msg))
+            self.app.schedule(partial(self.app.set_chat_message, "assistant", msg))
 
         return {"status": "success", "message": msg}
 
@@ -1151,7 +1157,7 @@ class MusicPlayer(Thing):
         msg = f"已跳转到: {pos_str}/{dur_str}"
 
         if self.app:
-            self.app.schedule(lambda: self.app.set_chat_message("assistant", msg))
+            self.app.schedule(partial(self.app.set_chat_message, "assistant", msg))
 
         return {"status": "success", "message": msg, "position": position}
 
@@ -1210,15 +1216,17 @@ class MusicPlayer(Thing):
                 if self.app:
                     dur_str = self._format_time(self.total_duration)
                     self.app.schedule(
-                        lambda: self.app.set_chat_message(
-                            "assistant", f"播放完成: {self.current_song} [{dur_str}]"
+                        partial(
+                            self.app.set_chat_message,
+                            "assistant",
+                            f"播放完成: {self.current_song} [{dur_str}]",
                         )
                     )
 
                 # 根据自动模式设置应用状态
                 if self.app:
                     self.app.schedule(
-                        lambda: self.app.set_device_state(DeviceState.IDLE)
+                        partial(self.app.set_device_state, DeviceState.IDLE)
                     )
                 break
 
@@ -1273,8 +1281,10 @@ class MusicPlayer(Thing):
 
             if self.app:
                 self.app.schedule(
-                    lambda: self.app.set_chat_message(
-                        "assistant", f"继续播放: {self.current_song}"
+                    partial(
+                        self.app.set_chat_message,
+                        "assistant",
+                        f"继续播放: {self.current_song}",
                     )
                 )
 
@@ -1314,7 +1324,8 @@ class MusicPlayer(Thing):
                 pos_str = self._format_time(self.current_position)
                 dur_str = self._format_time(self.total_duration)
                 self.app.schedule(
-                    lambda: self.app.set_chat_message(
+                    partial(
+                        self.app.set_chat_message,
                         "assistant",
                         f"已暂停: {self.current_song} [{pos_str}/{dur_str}]",
                     )
@@ -158,7 +158,9 @@ class TemperatureSensor(Thing):
                     print("[温度传感器] 打开音频通道失败")
                     return
             # 更新物联网设备状态
-            self.app._update_iot_states(delta=True)
+            asyncio.run_coroutine_threadsafe(
+                self.app._update_iot_states(delta=True), self.app.loop
+            )
 
             # 音频通道已打开，发送唤醒词消息
             asyncio.run_coroutine_threadsafe(
@@ -11,6 +11,7 @@ from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from src.constants.constants import AudioConfig
 from src.protocols.protocol import Protocol
 from src.utils.config_manager import ConfigManager
+from src.utils.json_utils import json_loads
 from src.utils.logging_config import get_logger
 
 # 配置日志
@@ -116,13 +117,12 @@ class MqttProtocol(Protocol):
         def on_connect_callback(client, userdata, flags, rc, properties=None):
             if rc == 0:
                 logger.info("已连接到MQTT服务器")
-                self.loop.call_soon_threadsafe(lambda: connect_future.set_result(True))
+                self.loop.call_soon_threadsafe(connect_future.set_result, True)
             else:
                 logger.error(f"连接MQTT服务器失败，返回码: {rc}")
                 self.loop.call_soon_threadsafe(
-                    lambda: connect_future.set_exception(
-                        Exception(f"连接MQTT服务器失败，返回码: {rc}")
-                    )
+                    connect_future.set_exception,
+                    Exception(f"连接MQTT服务器失败，返回码: {rc}"),
                 )
 
         def on_message_callback(client, userdata, msg):
@@ -230,7 +230,7 @@ class MqttProtocol(Protocol):
     def _handle_mqtt_message(self, payload):
         """处理MQTT消息."""
         try:
-            data = json.loads(payload)
+            data = json_loads(payload)
             msg_type = data.get("type")
 
             if msg_type == "goodbye":
@@ -277,7 +277,7 @@ class MqttProtocol(Protocol):
                 # 触发音频通道打开回调
                 if self.on_audio_channel_opened:
                     self.loop.call_soon_threadsafe(
-                        lambda: asyncio.create_task(self.on_audio_channel_opened())
+                        self.loop.create_task, self.on_audio_channel_opened()
                     )
 
             else:
@@ -13,6 +13,7 @@ import websockets
 from src.constants.constants import AudioConfig
 from src.protocols.protocol import Protocol
 from src.utils.config_manager import ConfigManager
+from src.utils.json_utils import json_loads
 from src.utils.logging_config import get_logger
 
 # Create an unverified SSL context for WSS connections
@@ -113,7 +114,7 @@ class WebsocketProtocol(Protocol):
             async for message in self.websocket:
                 if isinstance(message, str):
                     try:
-                        data = json.loads(message)
+                        data = json_loads(message)
                         msg_type = data.get("type")
                         if msg_type == "hello":
                             # Handle server hello message
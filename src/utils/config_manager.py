@@ -1,3 +1,4 @@
+import atexit
 import json
 import socket
 import threading
@@ -70,7 +71,9 @@ class ConfigManager:
             "subscribe_topic": "sensors/temperature/device_001/state",
         },
         "HOME_ASSISTANT": {"URL": "http://localhost:8123", "TOKEN": "", "DEVICES": []},
+        "MUSIC_PLAYER": {"ENABLED": True},
         "CAMERA": {
+            "ENABLED": True,
             "camera_index": 0,
             "frame_width": 640,
             "frame_height": 480,
@@ -94,6 +97,10 @@ class ConfigManager:
             return
         self._initialized = True
         self.device_activator = None
+        # 延迟写盘的定时器, 非None表示有尚未保存的更新
+        self._save_timer = None
+        self._save_timer_lock = threading.Lock()
+        self._flush_at_exit = False
         # 加载配置
         self._config = self._load_config()
         self.device_fingerprint = get_device_fingerprint()
@@ -175,16 +182,49 @@ class ConfigManager:
         path: 点分隔的配置路径，如 "network.mqtt.host"
         """
         try:
-            current = self._config
-            *parts, last = path.split(".")
-            for part in parts:
-                current = current.setdefault(part, {})
-            current[last] = value
+            self._set_value(path, value)
             return self._save_config(self._config)
         except Exception as e:
             logger.error(f"Error updating config {path}: {e}")
             return False
 
+    def update_config_deferred(self, path: str, value: Any, delay: float = 1.0):
+        """
+        更新配置项, 延迟写盘
+        内存中的配置立即生效; delay秒内的多次更新合并为一次文件写入
+        """
+        try:
+            self._set_value(path, value)
+        except Exception as e:
+            logger.error(f"Error updating config {path}: {e}")
+            return
+        with self._save_timer_lock:
+            if self._save_timer is None:
+                if not self._flush_at_exit:
+                    # 定时器是守护线程, 正常退出时不会等待它
+                    atexit.register(self.flush_config)
+                    self._flush_at_exit = True
+                self._save_timer = threading.Timer(delay, self.flush_config)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush_config(self) -> bool:
+        """立即保存尚未写盘的延迟更新."""
+        with self._save_timer_lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is None:
+            return True
+        timer.cancel()
+        return self._save_config(self._config)
+
+    def _set_value(self, path: str, value: Any):
+        """设置内存中的配置项."""
+        current = self._config
+        *parts, last = path.split(".")
+        for part in parts:
+            current = current.setdefault(part, {})
+        current[last] = value
+
     @classmethod
     def get_instance(cls):
         """获取配置管理器实例（线程安全）"""
@@ -0,0 +1,11 @@
+"""JSON解析工具 优先使用orjson, 未安装时回退到标准库json."""
+
+import json
+
+# orjson parses several times faster; its JSONDecodeError subclasses json's
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+__all__ = ["json_loads"]
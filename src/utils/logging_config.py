@@ -4,17 +4,30 @@ from logging.handlers import TimedRotatingFileHandler
 from colorlog import ColoredFormatter
 
 
-def setup_logging():
-    """配置日志系统."""
-    from .resource_finder import get_project_root
+def setup_logging(mode="gui", interactive=True):
+    """配置日志系统.
 
-    # 使用resource_finder获取项目根目录并创建logs目录
-    project_root = get_project_root()
-    log_dir = project_root / "logs"
-    log_dir.mkdir(exist_ok=True)
+    Args:
+        mode: 运行模式，gui 或 cli
+        interactive: 标准输出是否连接到终端
+
+    Returns:
+        日志文件路径；CLI 模式输出到管道时不写日志文件，返回 None
+    """
+    # CLI 模式被管道调用时只输出到控制台，不创建日志文件
+    use_file = interactive or mode == "gui"
+
+    log_file = None
+    if use_file:
+        from .resource_finder import get_project_root
 
-    # 日志文件路径
-    log_file = log_dir / "app.log"
+        # 使用resource_finder获取项目根目录并创建logs目录
+        project_root = get_project_root()
+        log_dir = project_root / "logs"
+        log_dir.mkdir(exist_ok=True)
+
+        # 日志文件路径
+        log_file = log_dir / "app.log"
 
     # 创建根日志记录器
     root_logger = logging.getLogger()
@@ -28,22 +41,6 @@ def setup_logging():
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
 
-    # 创建按天切割的文件处理器
-    file_handler = TimedRotatingFileHandler(
-        log_file,
-        when="midnight",  # 每天午夜切割
-        interval=1,  # 每1天
-        backupCount=30,  # 保留30天的日志
-        encoding="utf-8",
-    )
-    file_handler.setLevel(logging.INFO)
-    file_handler.suffix = "%Y-%m-%d.log"  # 日志文件后缀格式
-
-    # 创建格式化器
-    formatter = logging.Formatter(
-        "%(asctime)s[%(name)s] - %(levelname)s - %(message)s - %(threadName)s"
-    )
-
     # 控制台颜色格式化器
     color_formatter = ColoredFormatter(
         "%(green)s%(asctime)s%(reset)s[%(blue)s%(name)s%(reset)s] - "
@@ -59,14 +56,33 @@ def setup_logging():
         secondary_log_colors={"asctime": {"green": "green"}, "name": {"blue": "blue"}},
     )
     console_handler.setFormatter(color_formatter)
-    file_handler.setFormatter(formatter)
 
     # 添加处理器到根日志记录器
     root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
 
-    # 输出日志配置信息
-    logging.info("日志系统已初始化，日志文件: %s", log_file)
+    if log_file is not None:
+        # 创建按天切割的文件处理器
+        file_handler = TimedRotatingFileHandler(
+            log_file,
+            when="midnight",  # 每天午夜切割
+            interval=1,  # 每1天
+            backupCount=30,  # 保留30天的日志
+            encoding="utf-8",
+        )
+        file_handler.setLevel(logging.INFO)
+        file_handler.suffix = "%Y-%m-%d.log"  # 日志文件后缀格式
+
+        # 创建格式化器
+        formatter = logging.Formatter(
+            "%(asctime)s[%(name)s] - %(levelname)s - %(message)s - %(threadName)s"
+        )
+        file_handler.setFormatter(formatter)
+        root_logger.addHandler(file_handler)
+
+        # 输出日志配置信息
+        logging.info("日志系统已初始化，日志文件: %s", log_file)
+    else:
+        logging.info("日志系统已初始化，仅输出到控制台")
 
     return log_file
 